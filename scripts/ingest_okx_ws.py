@@ -0,0 +1,37 @@
+"""Stream OKX price, funding and open interest snapshots over websockets."""
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import argparse
+import asyncio
+
+from alpha_arena.config import settings
+from alpha_arena.db.migrate import migrate
+from alpha_arena.ingest.okx_ws import stream
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="OKX websocket snapshot ingestion")
+    parser.add_argument(
+        "--symbols",
+        default=settings.okx_default_symbol,
+        help="Comma-separated symbols, e.g. BTC/USDT:USDT,ETH/USDT:USDT",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    migrate()
+    args = parse_args()
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    try:
+        asyncio.run(stream(symbols))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -83,6 +83,8 @@ class Settings:
     risk_max_notional: float
     risk_max_leverage: float
     risk_min_confidence: float
+    jit_warmup: bool
+    env_validate: bool
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -147,6 +149,8 @@ class Settings:
             risk_max_notional=_get_float(os.getenv("RISK_MAX_NOTIONAL"), 20000.0),
             risk_max_leverage=_get_float(os.getenv("RISK_MAX_LEVERAGE"), 3.0),
             risk_min_confidence=_get_float(os.getenv("RISK_MIN_CONFIDENCE"), 0.6),
+            jit_warmup=_get_bool(os.getenv("AA_JIT_WARMUP"), default=False),
+            env_validate=_get_bool(os.getenv("AA_ENV_VALIDATE"), default=False),
         )
 
 
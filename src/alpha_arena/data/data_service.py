@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sqlite3
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Tuple
 
 import pandas as pd
 
@@ -156,6 +156,36 @@ class DataService:
             ).fetchone()
         return int(row["max_ts"]) if row and row["max_ts"] is not None else None
 
+    def get_candle_version(
+        self, symbol: str, timeframe: str, limit: int = 300
+    ) -> Optional[Tuple[int, int, int]]:
+        """(newest ts, oldest ts, rows) of the latest ``limit`` candles.
+
+        Read from the (symbol, timeframe, timestamp) index only; a new bar or a
+        backfilled one inside the window changes it.
+        """
+        with self._connect() as conn:
+            mapping = self._map_columns(
+                conn, "market_data", MARKET_DATA_MAPPING, required=("timestamp",)
+            )
+            ts_col = mapping["timestamp"]
+            row = conn.execute(
+                f"""
+                SELECT MAX(ts) AS max_ts, MIN(ts) AS min_ts, COUNT(*) AS row_count
+                FROM (
+                    SELECT {ts_col} AS ts
+                    FROM market_data
+                    WHERE symbol = ? AND timeframe = ?
+                    ORDER BY {ts_col} DESC
+                    LIMIT ?
+                )
+                """,
+                (symbol, timeframe, limit),
+            ).fetchone()
+        if not row or row["max_ts"] is None:
+            return None
+        return int(row["max_ts"]), int(row["min_ts"]), int(row["row_count"])
+
     def get_candles(self, symbol: str, timeframe: str, limit: int = 300) -> pd.DataFrame:
         if limit <= 0:
             return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
@@ -0,0 +1,40 @@
+"""Per-thread pooled sqlite connections."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+from alpha_arena.db.connection import get_connection
+
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA mmap_size = 268435456;",
+    "PRAGMA cache_size = -65536;",
+)
+
+_local = threading.local()
+
+
+def get_pooled_connection() -> sqlite3.Connection:
+    """Return this thread's shared connection, creating it on first use.
+
+    The connection is never closed by callers; ``with conn:`` still scopes a
+    transaction (commit on success, rollback on error).
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = get_connection()
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
+    return conn
+
+
+def close_pooled_connection() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 import json
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from alpha_arena.config import settings
@@ -155,8 +156,8 @@ class StrategyScorer:
         indicators = _compute_indicators(candles)
         regime = self.regime_classifier.classify(indicators)
         market_data = {
-            "last_price": float(candles.iloc[-1]["close"]),
-            "timestamp": int(candles.iloc[-1]["timestamp"]),
+            "last_price": float(candles["close"].iat[-1]),
+            "timestamp": int(candles["timestamp"].iat[-1]),
         }
         perf_scores = self.performance_repo.load_scores(symbol, timeframe)
 
@@ -208,42 +209,58 @@ class PortfolioScheduler:
         return selected
 
 
+# Regime indicator name -> column of the frame from _compute_indicator_frame.
+_INDICATOR_COLUMNS = {
+    "ADX": "adx",
+    "RSI": "rsi",
+    "BB_Width": "bb_width",
+    "BB_Width_Ratio": "bb_width_ratio",
+    "MACD": "macd",
+    "MACD_Signal": "macd_signal",
+    "MACD_Hist": "macd_hist",
+    "ATR_Percentile": "atr_percentile",
+    "Price_Efficiency": "price_efficiency",
+    "Volume_Trend": "volume_trend",
+}
+
+
 def _compute_indicators(candles: pd.DataFrame) -> Dict[str, float]:
     df = _compute_indicator_frame(candles)
-    return _extract_indicators(df.iloc[-1])
+    return _extract_indicators(df, 1)[-1]
 
 
 def _compute_indicator_frame(candles: pd.DataFrame) -> pd.DataFrame:
-    df = candles.copy()
-    df["rsi"] = rsi(df["close"], 14)
-    df["adx"] = adx(df, 14)
-    macd_df = macd(df["close"])
-    df["macd"] = macd_df["macd"]
-    df["macd_signal"] = macd_df["signal"]
-    df["macd_hist"] = macd_df["hist"]
-    bb = bollinger_bands(df["close"])
-    df["bb_width"] = bb["bandwidth"]
-    df["bb_width_ma"] = df["bb_width"].rolling(window=20).mean()
-    df["bb_width_ratio"] = df["bb_width"] / df["bb_width_ma"].replace(0, pd.NA)
-    df["atr_percentile"] = atr_percentile(df, period=14, lookback=100)
-    df["price_efficiency"] = price_efficiency(df, period=20)
-    df["volume_trend"] = volume_trend(df, period=20)
-    return df
-
-
-def _extract_indicators(row: pd.Series) -> Dict[str, float]:
-    return {
-        "ADX": _safe_float(row.get("adx")),
-        "RSI": _safe_float(row.get("rsi")),
-        "BB_Width": _safe_float(row.get("bb_width")),
-        "BB_Width_Ratio": _safe_float(row.get("bb_width_ratio")),
-        "MACD": _safe_float(row.get("macd")),
-        "MACD_Signal": _safe_float(row.get("macd_signal")),
-        "MACD_Hist": _safe_float(row.get("macd_hist")),
-        "ATR_Percentile": _safe_float(row.get("atr_percentile")),
-        "Price_Efficiency": _safe_float(row.get("price_efficiency")),
-        "Volume_Trend": _safe_float(row.get("volume_trend")),
-    }
+    """Indicator columns only, aligned with ``candles`` (which is not copied)."""
+    close = candles["close"]
+    macd_df = macd(close)
+    bb_width = bollinger_bands(close)["bandwidth"]
+    bb_width_ma = bb_width.rolling(window=20).mean()
+    return pd.DataFrame(
+        {
+            "rsi": rsi(close, 14),
+            "adx": adx(candles, 14),
+            "macd": macd_df["macd"],
+            "macd_signal": macd_df["signal"],
+            "macd_hist": macd_df["hist"],
+            "bb_width": bb_width,
+            "bb_width_ratio": bb_width / bb_width_ma.where(bb_width_ma != 0),
+            "atr_percentile": atr_percentile(candles, period=14, lookback=100),
+            "price_efficiency": price_efficiency(candles, period=20),
+            "volume_trend": volume_trend(candles, period=20),
+        },
+        index=candles.index,
+    )
+
+
+def _extract_indicators(df: pd.DataFrame, rows: int) -> List[Dict[str, float]]:
+    """Indicator dicts for the last ``rows`` rows, read from one NumPy block."""
+    values = df[list(_INDICATOR_COLUMNS.values())].tail(rows).to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    return [
+        {key: _safe_float(value) for key, value in zip(_INDICATOR_COLUMNS, row)}
+        for row in values.tolist()
+    ]
 
 
 def _detect_regime(
@@ -316,13 +333,14 @@ def compute_regime_context(
         else settings.regime_bb_width_threshold
     )
 
-    latest = _extract_indicators(df.iloc[-1])
+    rows = _extract_indicators(df, max(history_len, 1))
+    latest = rows[-1]
     current_regime = _detect_regime(latest, adx_threshold, bb_width_threshold)
 
-    history: List[str] = []
-    for _, row in df.tail(history_len).iterrows():
-        row_indicators = _extract_indicators(row)
-        history.append(_detect_regime(row_indicators, adx_threshold, bb_width_threshold))
+    history: List[str] = [
+        _detect_regime(row, adx_threshold, bb_width_threshold)
+        for row in (rows[-history_len:] if history_len > 0 else [])
+    ]
 
     signals = {
         "ADX": latest.get("ADX"),
@@ -121,9 +121,8 @@ class LLMStrategySelector:
     def _build_market_data(
         self, symbol: str, timeframe: str, candles: pd.DataFrame
     ) -> Dict[str, Any]:
-        last = candles.iloc[-1]
-        last_price = float(last["close"])
-        last_volume = float(last["volume"])
+        last_price = float(candles["close"].iat[-1])
+        last_volume = float(candles["volume"].iat[-1])
         ohlcv_tail = (
             candles.tail(5)[["timestamp", "open", "high", "low", "close", "volume"]]
             .to_dict(orient="records")
@@ -131,41 +130,33 @@ class LLMStrategySelector:
         return {
             "symbol": symbol,
             "timeframe": timeframe,
-            "timestamp": int(last["timestamp"]),
+            "timestamp": int(candles["timestamp"].iat[-1]),
             "last_price": last_price,
             "last_volume": last_volume,
             "ohlcv_tail": ohlcv_tail,
         }
 
     def _build_indicators(self, candles: pd.DataFrame) -> Dict[str, Any]:
-        df = candles.copy()
-        df["rsi"] = rsi(df["close"], 14)
-        df["adx"] = adx(df, 14)
-        macd_df = macd(df["close"])
-        df["macd"] = macd_df["macd"]
-        df["macd_signal"] = macd_df["signal"]
-        df["macd_hist"] = macd_df["hist"]
-        bb = bollinger_bands(df["close"])
-        df["bb_width"] = bb["bandwidth"]
-        df["bb_width_ma"] = df["bb_width"].rolling(window=20).mean()
-        df["bb_width_ratio"] = df["bb_width"] / df["bb_width_ma"].replace(0, pd.NA)
-        df["atr_percentile"] = atr_percentile(df, period=14, lookback=100)
-        df["price_efficiency"] = price_efficiency(df, period=20)
-        df["volume_trend"] = volume_trend(df, period=20)
-
-        last = df.iloc[-1]
-        return {
-            "ADX": _safe_float(last["adx"]),
-            "RSI": _safe_float(last["rsi"]),
-            "BB_Width": _safe_float(last["bb_width"]),
-            "BB_Width_Ratio": _safe_float(last["bb_width_ratio"]),
-            "MACD": _safe_float(last["macd"]),
-            "MACD_Signal": _safe_float(last["macd_signal"]),
-            "MACD_Hist": _safe_float(last["macd_hist"]),
-            "ATR_Percentile": _safe_float(last["atr_percentile"]),
-            "Price_Efficiency": _safe_float(last["price_efficiency"]),
-            "Volume_Trend": _safe_float(last["volume_trend"]),
+        # Only the last row is reported, so keep each series local rather than
+        # copying the frame and attaching a column per indicator.
+        close = candles["close"]
+        macd_frame = macd(close)
+        bb_width = bollinger_bands(close)["bandwidth"]
+        bb_width_last = bb_width.iat[-1]
+        bb_width_ma = bb_width.rolling(window=20).mean().iat[-1]
+        values = {
+            "ADX": adx(candles, 14).iat[-1],
+            "RSI": rsi(close, 14).iat[-1],
+            "BB_Width": bb_width_last,
+            "BB_Width_Ratio": bb_width_last / bb_width_ma if bb_width_ma else None,
+            "MACD": macd_frame["macd"].iat[-1],
+            "MACD_Signal": macd_frame["signal"].iat[-1],
+            "MACD_Hist": macd_frame["hist"].iat[-1],
+            "ATR_Percentile": atr_percentile(candles, period=14, lookback=100).iat[-1],
+            "Price_Efficiency": price_efficiency(candles, period=20).iat[-1],
+            "Volume_Trend": volume_trend(candles, period=20).iat[-1],
         }
+        return {key: _safe_float(value) for key, value in values.items()}
 
     def _build_regime_context(self, candles: pd.DataFrame) -> Dict[str, Any]:
         try:
@@ -108,7 +108,7 @@ class PortfolioAllocator:
         candles = self.data_service.get_candles(symbol, "1h", limit=1)
         if candles.empty:
             return None
-        return float(candles.iloc[-1]["close"])
+        return float(candles["close"].iat[-1])
 
     def _current_notional(self, positions: Iterable[Dict], price: float) -> float:
         total = 0.0
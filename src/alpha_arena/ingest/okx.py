@@ -2,17 +2,38 @@
 
 from __future__ import annotations
 
+import json
 import os
+import threading
 import time
+from functools import lru_cache
 from typing import Iterable, Optional
 
 import ccxt
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from alpha_arena.config import settings
-from alpha_arena.db.connection import get_connection
+from alpha_arena.db.pool import get_pooled_connection
 from alpha_arena.utils.time import utc_now_ms, utc_now_s
 
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+OKX_REST_BASE = "https://www.okx.com"
+# OKX caps /market/history-candles at 300 rows per request.
+OKX_MAX_CANDLES = 300
+
+# ccxt's built-in throttle is not thread-safe; serialize calls on the shared client
+# (only the calls themselves, not the DB writes or pacing sleeps around them).
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
 def _load_proxies() -> dict[str, str] | None:
     http_proxy = (
         os.getenv("OKX_HTTP_PROXY")
@@ -54,7 +75,7 @@ def create_okx_client() -> ccxt.okx:
     )
     proxies = _load_proxies()
     if proxies:
-        exchange.proxies = proxies
+        exchange.proxies = dict(proxies)
     try:
         exchange.set_sandbox_mode(settings.okx_is_demo)
     except AttributeError:
@@ -64,6 +85,91 @@ def create_okx_client() -> ccxt.okx:
     return exchange
 
 
+@lru_cache(maxsize=1)
+def _shared_okx_client() -> ccxt.okx:
+    """Process-wide client with markets loaded once (ccxt caches per instance)."""
+    exchange = create_okx_client()
+    exchange.load_markets()
+    return exchange
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """Keep-alive HTTP client reused by the fast candle path."""
+    proxies = _load_proxies()
+    headers = {"x-simulated-trading": "1"} if settings.okx_is_demo else None
+    return httpx.Client(
+        base_url=OKX_REST_BASE,
+        headers=headers,
+        proxy=proxies.get("https") if proxies else None,
+        timeout=30.0,
+    )
+
+
+def _okx_candle_request(
+    exchange: ccxt.okx, symbol: str, timeframe: str
+) -> tuple[str, str, int]:
+    """Resolve (instId, bar, volume column) the way ccxt's fetch_ohlcv does."""
+    exchange.load_markets()
+    market = exchange.market(symbol)
+    bar = exchange.timeframes.get(timeframe, timeframe)
+    # ccxt requests UTC-anchored bars for 6h and longer.
+    if exchange.parse_timeframe(timeframe) >= 21600:
+        bar += "utc"
+    return market["id"], bar, 5 if market["spot"] else 6
+
+
+def fast_fetch_ohlcv(
+    session: httpx.Client,
+    inst_id: str,
+    bar: str,
+    since: int,
+    limit: int,
+    timeframe_ms: int,
+    volume_index: int = 6,
+) -> Optional[list[list[float]]]:
+    """Fetch candles from ``since`` onward without ccxt's generic request pipeline.
+
+    Returns ascending ``[ts, open, high, low, close, volume]`` rows like
+    ``fetch_ohlcv``, or ``None`` when the request fails so the caller can
+    fall back to ccxt.
+    """
+    limit = min(limit, OKX_MAX_CANDLES)
+    params = {
+        "instId": inst_id,
+        "bar": bar,
+        "before": max(since - 1, 0),
+        "after": since + timeframe_ms * limit,
+        "limit": limit,
+    }
+    try:
+        resp = session.get("/api/v5/market/history-candles", params=params)
+    except httpx.HTTPError:
+        return None
+    if resp.status_code != 200:
+        return None
+    # Anything unexpected (HTML error page, schema change) falls back to ccxt.
+    try:
+        payload = _json_loads(resp.content)
+        if payload.get("code") != "0":
+            return None
+        rows = [
+            [
+                int(r[0]),
+                float(r[1]),
+                float(r[2]),
+                float(r[3]),
+                float(r[4]),
+                float(r[volume_index]),
+            ]
+            for r in payload["data"]
+        ]
+    except (ValueError, KeyError, TypeError, AttributeError, IndexError):
+        return None
+    rows.reverse()
+    return rows
+
+
 def _start_ingestion_run(conn, symbol: str, timeframe: Optional[str], data_type: str) -> int:
     cur = conn.execute(
         """
@@ -93,13 +199,15 @@ def _finish_ingestion_run(
 def _get_latest_ohlcv_timestamp(conn, symbol: str, timeframe: str) -> Optional[int]:
     row = conn.execute(
         """
-        SELECT MAX(timestamp) AS max_ts
+        SELECT timestamp
         FROM market_data
         WHERE symbol = ? AND timeframe = ?
+        ORDER BY timestamp DESC
+        LIMIT 1
         """,
         (symbol, timeframe),
     ).fetchone()
-    return int(row["max_ts"]) if row and row["max_ts"] is not None else None
+    return int(row["timestamp"]) if row else None
 
 
 def _insert_ohlcv(conn, symbol: str, timeframe: str, candles: list[list[float]]) -> int:
@@ -132,7 +240,7 @@ def ingest_ohlcv(
 ) -> int:
     timeframe_ms = int(exchange.parse_timeframe(timeframe) * 1000)
     total = 0
-    with get_connection() as conn:
+    with get_pooled_connection() as conn:
         last_ts = _get_latest_ohlcv_timestamp(conn, symbol, timeframe)
         if override_since and since_ms is not None:
             since = max(int(since_ms), 0)
@@ -143,8 +251,19 @@ def ingest_ohlcv(
 
         run_id = _start_ingestion_run(conn, symbol, timeframe, "ohlcv")
         try:
+            with _SHARED_CLIENT_LOCK:
+                inst_id, bar, volume_index = _okx_candle_request(exchange, symbol, timeframe)
+            session = _shared_http_client()
+            page_limit = min(limit, OKX_MAX_CANDLES)
             while True:
-                candles = exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+                candles = fast_fetch_ohlcv(
+                    session, inst_id, bar, since, page_limit, timeframe_ms, volume_index
+                )
+                if candles is None:
+                    with _SHARED_CLIENT_LOCK:
+                        candles = exchange.fetch_ohlcv(
+                            symbol, timeframe, since=since, limit=page_limit
+                        )
                 if not candles:
                     break
                 inserted = _insert_ohlcv(conn, symbol, timeframe, candles)
@@ -152,7 +271,7 @@ def ingest_ohlcv(
                 since = candles[-1][0] + timeframe_ms
                 if max_bars and total >= max_bars:
                     break
-                if len(candles) < limit:
+                if len(candles) < page_limit:
                     break
             _finish_ingestion_run(conn, run_id, "success", total)
         except Exception as exc:  # pragma: no cover - runtime ingestion guard
@@ -162,10 +281,11 @@ def ingest_ohlcv(
 
 
 def ingest_funding_rate(exchange: ccxt.okx, symbol: str) -> int:
-    with get_connection() as conn:
+    with get_pooled_connection() as conn:
         run_id = _start_ingestion_run(conn, symbol, None, "funding_rate")
         try:
-            funding = exchange.fetch_funding_rate(symbol)
+            with _SHARED_CLIENT_LOCK:
+                funding = exchange.fetch_funding_rate(symbol)
             timestamp = funding.get("timestamp") or utc_now_ms()
             rate = funding.get("fundingRate")
             next_time = funding.get("nextFundingTimestamp")
@@ -189,10 +309,11 @@ def ingest_funding_rate(exchange: ccxt.okx, symbol: str) -> int:
 
 
 def ingest_price_snapshot(exchange: ccxt.okx, symbol: str) -> int:
-    with get_connection() as conn:
+    with get_pooled_connection() as conn:
         run_id = _start_ingestion_run(conn, symbol, None, "price_snapshot")
         try:
-            ticker = exchange.fetch_ticker(symbol)
+            with _SHARED_CLIENT_LOCK:
+                ticker = exchange.fetch_ticker(symbol)
             timestamp = ticker.get("timestamp") or utc_now_ms()
             last_price = ticker.get("last")
             mark_price = ticker.get("mark")
@@ -214,10 +335,11 @@ def ingest_price_snapshot(exchange: ccxt.okx, symbol: str) -> int:
 
 
 def ingest_open_interest(exchange: ccxt.okx, symbol: str) -> int:
-    with get_connection() as conn:
+    with get_pooled_connection() as conn:
         run_id = _start_ingestion_run(conn, symbol, None, "open_interest")
         try:
-            data = exchange.fetch_open_interest(symbol)
+            with _SHARED_CLIENT_LOCK:
+                data = exchange.fetch_open_interest(symbol)
             timestamp = data.get("timestamp") or utc_now_ms()
             oi = data.get("openInterest")
             oi_value = data.get("openInterestValue")
@@ -247,11 +369,11 @@ def ingest_all(
     limit: int = 200,
     max_bars: Optional[int] = None,
 ) -> dict[str, int]:
-    exchange = create_okx_client()
-    exchange.load_markets()
     since_ms = utc_now_ms() - since_days * 24 * 60 * 60 * 1000
 
     results = {"funding_rate": 0, "price_snapshot": 0, "open_interest": 0}
+    with _SHARED_CLIENT_LOCK:
+        exchange = _shared_okx_client()
     results["funding_rate"] = ingest_funding_rate(exchange, symbol)
     results["price_snapshot"] = ingest_price_snapshot(exchange, symbol)
 
@@ -0,0 +1,182 @@
+"""OKX websocket ingestion for price, funding and open interest snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import ccxt
+import ccxt.pro as ccxtpro
+
+from alpha_arena.config import settings
+from alpha_arena.db.connection import get_connection
+from alpha_arena.ingest.okx import _load_proxies
+from alpha_arena.utils.time import utc_now_ms
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_ROWS = 1000
+BATCH_MAX_WAIT_S = 0.5
+QUEUE_MAX_SIZE = 10000
+RETRY_DELAY_S = 5.0
+
+_INSERT_SQL = {
+    "price_snapshots": """
+        INSERT INTO price_snapshots (symbol, timestamp, last_price, mark_price, index_price)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(symbol, timestamp) DO NOTHING
+    """,
+    "funding_rates": """
+        INSERT INTO funding_rates (symbol, timestamp, funding_rate, next_funding_time)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(symbol, timestamp) DO NOTHING
+    """,
+    "open_interest": """
+        INSERT INTO open_interest (symbol, timestamp, open_interest, open_interest_value)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(symbol, timestamp) DO NOTHING
+    """,
+}
+
+Row = tuple[str, tuple[Any, ...]]
+
+
+def create_okx_ws_client() -> ccxtpro.okx:
+    exchange = ccxtpro.okx(
+        {
+            "apiKey": settings.okx_api_key,
+            "secret": settings.okx_api_secret,
+            "password": settings.okx_password,
+            "enableRateLimit": True,
+            "timeout": 30000,
+            "options": {"defaultType": settings.okx_default_market},
+        }
+    )
+    proxies = _load_proxies()
+    if proxies and proxies.get("https"):
+        exchange.ws_proxy = proxies["https"]
+    try:
+        exchange.set_sandbox_mode(settings.okx_is_demo)
+    except AttributeError:
+        exchange.options["sandboxMode"] = settings.okx_is_demo
+    if settings.okx_default_market:
+        exchange.options["fetchMarkets"] = {"types": [settings.okx_default_market]}
+    return exchange
+
+
+def _ticker_row(symbol: str, ticker: dict) -> Row:
+    return (
+        "price_snapshots",
+        (
+            symbol,
+            ticker.get("timestamp") or utc_now_ms(),
+            ticker.get("last"),
+            ticker.get("mark"),
+            ticker.get("index"),
+        ),
+    )
+
+
+def _funding_row(symbol: str, funding: dict) -> Optional[Row]:
+    rate = funding.get("fundingRate")
+    if rate is None:
+        return None
+    return (
+        "funding_rates",
+        (
+            symbol,
+            funding.get("timestamp") or utc_now_ms(),
+            rate,
+            funding.get("nextFundingTimestamp"),
+        ),
+    )
+
+
+def _open_interest_row(symbol: str, data: dict) -> Optional[Row]:
+    oi = data.get("openInterest")
+    if oi is None:
+        return None
+    return (
+        "open_interest",
+        (
+            symbol,
+            data.get("timestamp") or utc_now_ms(),
+            oi,
+            data.get("openInterestValue"),
+        ),
+    )
+
+
+async def _watch(
+    watch: Callable[[str], Awaitable[dict]],
+    to_row: Callable[[str, dict], Optional[Row]],
+    symbol: str,
+    queue: asyncio.Queue,
+) -> None:
+    while True:
+        try:
+            payload = await watch(symbol)
+        except ccxt.NotSupported as exc:
+            logger.warning("OKX websocket feed unavailable for %s: %s", symbol, exc)
+            return
+        except Exception as exc:  # pragma: no cover - runtime network guard
+            logger.warning("OKX websocket error for %s: %s", symbol, exc)
+            await asyncio.sleep(RETRY_DELAY_S)
+            continue
+        row = to_row(symbol, payload)
+        if row is not None:
+            await queue.put(row)
+
+
+def _flush(batch: list[Row]) -> int:
+    # Runs in a worker thread, so it opens its own connection.
+    grouped: dict[str, list[tuple[Any, ...]]] = {}
+    for table, values in batch:
+        grouped.setdefault(table, []).append(values)
+    conn = get_connection()
+    try:
+        for table, rows in grouped.items():
+            conn.executemany(_INSERT_SQL[table], rows)
+        conn.commit()
+    finally:
+        conn.close()
+    return len(batch)
+
+
+async def _consume(queue: asyncio.Queue) -> None:
+    while True:
+        batch: list[Row] = [await queue.get()]
+        deadline = time.monotonic() + BATCH_MAX_WAIT_S
+        while len(batch) < BATCH_MAX_ROWS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        # Keep SQLite writes off the event loop so the watchers keep reading.
+        await asyncio.to_thread(_flush, batch)
+
+
+async def stream(symbols: Iterable[str]) -> None:
+    """Subscribe to ticker/funding/OI feeds and write them to SQLite in batches."""
+    exchange = create_okx_ws_client()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAX_SIZE)
+    tasks = [_consume(queue)]
+    for symbol in symbols:
+        tasks.append(_watch(exchange.watch_ticker, _ticker_row, symbol, queue))
+        if exchange.has.get("watchFundingRate"):
+            tasks.append(
+                _watch(exchange.watch_funding_rate, _funding_row, symbol, queue)
+            )
+        if exchange.has.get("watchOpenInterest"):
+            tasks.append(
+                _watch(exchange.watch_open_interest, _open_interest_row, symbol, queue)
+            )
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await exchange.close()
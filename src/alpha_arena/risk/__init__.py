@@ -5,7 +5,9 @@ from alpha_arena.risk.manager import (
     MaxLeverageRule,
     MaxNotionalRule,
     RiskManager,
+    RiskReason,
     RiskRule,
+    format_reason,
 )
 
 __all__ = [
@@ -13,5 +15,7 @@ __all__ = [
     "MaxLeverageRule",
     "MaxNotionalRule",
     "RiskManager",
+    "RiskReason",
     "RiskRule",
+    "format_reason",
 ]
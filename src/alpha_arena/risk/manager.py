@@ -4,19 +4,55 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from enum import Enum
+from typing import Any, List, Optional, Tuple, Union
 
 from alpha_arena.config import settings
-from alpha_arena.db.connection import get_connection
+from alpha_arena.db.pool import get_pooled_connection
 from alpha_arena.models.order import Order
 from alpha_arena.utils.time import utc_now_s
 
+try:
+    from enum import StrEnum
+except ImportError:  # pragma: no cover - Python < 3.11
+
+    class StrEnum(str, Enum):
+        __str__ = str.__str__
+        __format__ = str.__format__
+
+
+class RiskReason(StrEnum):
+    OK = "ok"
+    MISSING_PRICE = "missing price for notional check"
+    NOTIONAL = "notional {0:.2f} exceeds max {1:.2f}"
+    LEVERAGE = "leverage {0} exceeds max {1}"
+    SIGNAL_FAILED = "signal marked as failed"
+    CONFIDENCE = "confidence {0:.2f} below {1:.2f}"
+
+
+# (passed, reason code, format args); the message is only rendered on failure.
+RuleResult = Tuple[bool, RiskReason, Tuple[Any, ...]]
+# Pre-RiskReason rules returned (passed, message); RiskManager still accepts them.
+LegacyRuleResult = Tuple[bool, str]
+
+_OK: RuleResult = (True, RiskReason.OK, ())
+
+
+def format_reason(reason: Union[RiskReason, str], args: Tuple[Any, ...] = ()) -> str:
+    return reason.format(*args) if args else str(reason)
+
 
 class RiskRule(ABC):
+    """A single pre-trade check.
+
+    ``check`` returns a :data:`RuleResult` ``(passed, reason, args)``. Rules
+    written against the older ``(passed, message)`` contract keep working.
+    """
+
     name: str
 
     @abstractmethod
-    def check(self, order: Order) -> Tuple[bool, str]:
+    def check(self, order: Order) -> Union[RuleResult, LegacyRuleResult]:
         raise NotImplementedError
 
 
@@ -25,13 +61,13 @@ class MaxNotionalRule(RiskRule):
     max_notional: float
     name: str = "max_notional"
 
-    def check(self, order: Order) -> Tuple[bool, str]:
+    def check(self, order: Order) -> RuleResult:
         if order.price is None:
-            return False, "missing price for notional check"
+            return False, RiskReason.MISSING_PRICE, ()
         notional = order.price * order.quantity
         if notional > self.max_notional:
-            return False, f"notional {notional:.2f} exceeds max {self.max_notional:.2f}"
-        return True, "ok"
+            return False, RiskReason.NOTIONAL, (notional, self.max_notional)
+        return _OK
 
 
 @dataclass(frozen=True)
@@ -39,12 +75,12 @@ class MaxLeverageRule(RiskRule):
     max_leverage: float
     name: str = "max_leverage"
 
-    def check(self, order: Order) -> Tuple[bool, str]:
+    def check(self, order: Order) -> RuleResult:
         if order.leverage is None:
-            return True, "ok"
+            return _OK
         if order.leverage > self.max_leverage:
-            return False, f"leverage {order.leverage} exceeds max {self.max_leverage}"
-        return True, "ok"
+            return False, RiskReason.LEVERAGE, (order.leverage, self.max_leverage)
+        return _OK
 
 
 @dataclass(frozen=True)
@@ -52,12 +88,12 @@ class CircuitBreakerRule(RiskRule):
     min_confidence: float
     name: str = "circuit_breaker"
 
-    def check(self, order: Order) -> Tuple[bool, str]:
+    def check(self, order: Order) -> RuleResult:
         if order.signal_ok is False:
-            return False, "signal marked as failed"
+            return False, RiskReason.SIGNAL_FAILED, ()
         if order.confidence is not None and order.confidence < self.min_confidence:
-            return False, f"confidence {order.confidence:.2f} below {self.min_confidence:.2f}"
-        return True, "ok"
+            return False, RiskReason.CONFIDENCE, (order.confidence, self.min_confidence)
+        return _OK
 
 
 class RiskManager:
@@ -74,19 +110,31 @@ class RiskManager:
 
     def check(self, order: Order) -> Tuple[bool, str, str]:
         for rule in self.rules:
-            passed, reason = rule.check(order)
+            result = rule.check(order)
+            if len(result) == 2:
+                (passed, reason), args = result, ()
+            else:
+                passed, reason, args = result
             if not passed:
-                self._record_event(order, rule.name, reason)
-                return False, reason, rule.name
-        return True, "ok", ""
-
-    def _record_event(self, order: Order, rule_name: str, reason: str) -> None:
-        with get_connection() as conn:
+                message = self._record_event(order, rule.name, reason, args)
+                return False, message, rule.name
+        return True, RiskReason.OK.value, ""
+
+    def _record_event(
+        self,
+        order: Order,
+        rule_name: str,
+        reason: Union[RiskReason, str],
+        args: Tuple[Any, ...],
+    ) -> str:
+        message = format_reason(reason, args)
+        with get_pooled_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO risk_events (symbol, timestamp, level, rule, details)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (order.symbol, utc_now_s(), "block", rule_name, reason),
+                (order.symbol, utc_now_s(), "block", rule_name, message),
             )
             conn.commit()
+        return message
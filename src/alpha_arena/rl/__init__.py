@@ -1,7 +1,8 @@
 """Reinforcement learning modules."""
 
 from alpha_arena.rl.trading_env import TradingEnv
+from alpha_arena.rl.trading_env_vec import BatchedTradingEnv
 from alpha_arena.rl.rl_integration import RLDecisionMaker
 
-__all__ = ["TradingEnv", "RLDecisionMaker"]
+__all__ = ["TradingEnv", "BatchedTradingEnv", "RLDecisionMaker"]
 
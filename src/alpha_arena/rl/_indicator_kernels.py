@@ -0,0 +1,326 @@
+"""Numba kernels for RL indicator features."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from alpha_arena.utils._njit import njit
+
+# Periods match the TA-Lib calls in TradingEnv.
+RSI_PERIOD = 14
+EMA_FAST_PERIOD = 12
+EMA_SLOW_PERIOD = 26
+BB_PERIOD = 20
+BB_NSTD = 2.0
+ATR_PERIOD = 14
+VOL_PERIOD = 20
+
+# Incremental state layout (float64 so rolling sums do not lose precision).
+_N = 0
+_PREV_CLOSE = 1
+_SEED_SUM = 2
+_EMA_FAST = 3
+_EMA_SLOW = 4
+_GAIN = 5
+_LOSS = 6
+_TR = 7
+_BB_SUM = 8
+_BB_SQ = 9
+_VOL_SUM = 10
+_LAST_VOL = 11
+_CLOSE_RING = 12
+_VOL_RING = _CLOSE_RING + BB_PERIOD
+STATE_SIZE = _VOL_RING + VOL_PERIOD
+
+
+def new_indicator_state() -> np.ndarray:
+    return np.zeros(STATE_SIZE, dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def update_indicators(
+    state: np.ndarray, close: float, high: float, low: float, volume: float
+) -> np.ndarray:
+    """Fold one closed bar into ``state`` in place, TA-Lib seeding semantics."""
+    n = int(state[_N])
+    prev_close = state[_PREV_CLOSE]
+
+    # EMA: seeded with the SMA of the first ``period`` closes.
+    if n < EMA_SLOW_PERIOD:
+        state[_SEED_SUM] += close
+    if n + 1 == EMA_FAST_PERIOD:
+        state[_EMA_FAST] = state[_SEED_SUM] / EMA_FAST_PERIOD
+    elif n + 1 > EMA_FAST_PERIOD:
+        a = 2.0 / (EMA_FAST_PERIOD + 1)
+        state[_EMA_FAST] = a * close + (1.0 - a) * state[_EMA_FAST]
+    if n + 1 == EMA_SLOW_PERIOD:
+        state[_EMA_SLOW] = state[_SEED_SUM] / EMA_SLOW_PERIOD
+    elif n + 1 > EMA_SLOW_PERIOD:
+        a = 2.0 / (EMA_SLOW_PERIOD + 1)
+        state[_EMA_SLOW] = a * close + (1.0 - a) * state[_EMA_SLOW]
+
+    # RSI / ATR: Wilder smoothing seeded with the mean of the first ``period`` values.
+    if n > 0:
+        change = close - prev_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        if n <= RSI_PERIOD:
+            state[_GAIN] += gain / RSI_PERIOD
+            state[_LOSS] += loss / RSI_PERIOD
+        else:
+            state[_GAIN] = (state[_GAIN] * (RSI_PERIOD - 1) + gain) / RSI_PERIOD
+            state[_LOSS] = (state[_LOSS] * (RSI_PERIOD - 1) + loss) / RSI_PERIOD
+        if n <= ATR_PERIOD:
+            state[_TR] += tr / ATR_PERIOD
+        else:
+            state[_TR] = (state[_TR] * (ATR_PERIOD - 1) + tr) / ATR_PERIOD
+
+    # Bollinger / volume SMA: ring buffers with running sums.
+    slot = _CLOSE_RING + n % BB_PERIOD
+    if n >= BB_PERIOD:
+        old = state[slot]
+        state[_BB_SUM] -= old
+        state[_BB_SQ] -= old * old
+    state[slot] = close
+    state[_BB_SUM] += close
+    state[_BB_SQ] += close * close
+
+    slot = _VOL_RING + n % VOL_PERIOD
+    if n >= VOL_PERIOD:
+        state[_VOL_SUM] -= state[slot]
+    state[slot] = volume
+    state[_VOL_SUM] += volume
+
+    state[_PREV_CLOSE] = close
+    state[_LAST_VOL] = volume
+    state[_N] = n + 1
+    return state
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def replay_indicators(
+    state: np.ndarray,
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    start: int,
+) -> np.ndarray:
+    for i in range(start, close.shape[0]):
+        update_indicators(state, close[i], high[i], low[i], volume[i])
+    return state
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def indicator_values(state: np.ndarray) -> np.ndarray:
+    """Return [rsi, ema_fast, ema_slow, bb_upper, bb_mid, bb_lower, atr, vol_ratio]."""
+    out = np.zeros(8, dtype=np.float32)
+    n = int(state[_N])
+    if n > RSI_PERIOD:
+        total = state[_GAIN] + state[_LOSS]
+        out[0] = 100.0 * state[_GAIN] / total if total > 0 else 0.0
+    if n >= EMA_FAST_PERIOD:
+        out[1] = state[_EMA_FAST]
+    if n >= EMA_SLOW_PERIOD:
+        out[2] = state[_EMA_SLOW]
+    if n >= BB_PERIOD:
+        mean = state[_BB_SUM] / BB_PERIOD
+        var = state[_BB_SQ] / BB_PERIOD - mean * mean
+        std = np.sqrt(var) if var > 0 else 0.0
+        out[3] = mean + BB_NSTD * std
+        out[4] = mean
+        out[5] = mean - BB_NSTD * std
+    if n > ATR_PERIOD:
+        out[6] = state[_TR]
+    if n >= VOL_PERIOD:
+        vol_sma = state[_VOL_SUM] / VOL_PERIOD
+        out[7] = state[_LAST_VOL] / vol_sma if vol_sma > 0 else 0.0
+    return out
+
+
+def warmup() -> None:
+    """Compile (or load from cache) the full-series TradingEnv kernels."""
+    bars = np.linspace(1.0, 2.0, 32)
+    out = np.empty_like(bars)
+    _sma(bars, VOL_PERIOD, out)
+    _ema(bars, EMA_FAST_PERIOD, out)
+    _rsi(bars, RSI_PERIOD, out)
+    _atr(bars, bars, bars, ATR_PERIOD, out)
+    _bbands(bars, BB_PERIOD, BB_NSTD, out, np.empty_like(bars), np.empty_like(bars))
+    _rolling_moments(np.diff(bars), 8, np.empty((bars.size, 4)))
+
+
+def warmup_incremental() -> None:
+    """Trigger JIT compilation (or cache load) before the first live tick."""
+    state = new_indicator_state()
+    bars = np.linspace(1.0, 2.0, 32)
+    replay_indicators(state, bars, bars, bars, bars, 0)
+    indicator_values(state)
+
+
+# Full-series kernels for TradingEnv. Each writes into a caller-provided
+# buffer and leaves the TA-Lib lookback prefix as NaN.
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _sma(x: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    n = x.shape[0]
+    out[: min(period - 1, n)] = np.nan
+    total = 0.0
+    for i in range(n):
+        total += x[i]
+        if i >= period:
+            total -= x[i - period]
+        if i >= period - 1:
+            out[i] = total / period
+    return out
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _ema(close: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    n = close.shape[0]
+    out[: min(period - 1, n)] = np.nan
+    if n < period:
+        return out
+    total = 0.0
+    for i in range(period):
+        total += close[i]
+    value = total / period
+    out[period - 1] = value
+    a = 2.0 / (period + 1)
+    for i in range(period, n):
+        value = a * close[i] + (1.0 - a) * value
+        out[i] = value
+    return out
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _rsi(close: np.ndarray, period: int, out: np.ndarray) -> np.ndarray:
+    n = close.shape[0]
+    out[: min(period, n)] = np.nan
+    if n <= period:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+    gain /= period
+    loss /= period
+    total = gain + loss
+    out[period] = 100.0 * gain / total if total > 0 else 0.0
+    for i in range(period + 1, n):
+        change = close[i] - close[i - 1]
+        up = change if change > 0 else 0.0
+        down = -change if change < 0 else 0.0
+        gain = (gain * (period - 1) + up) / period
+        loss = (loss * (period - 1) + down) / period
+        total = gain + loss
+        out[i] = 100.0 * gain / total if total > 0 else 0.0
+    return out
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int, out: np.ndarray
+) -> np.ndarray:
+    n = close.shape[0]
+    out[: min(period, n)] = np.nan
+    if n <= period:
+        return out
+    value = 0.0
+    for i in range(1, n):
+        prev = close[i - 1]
+        tr = max(high[i] - low[i], abs(high[i] - prev), abs(low[i] - prev))
+        if i < period:
+            value += tr
+        elif i == period:
+            value = (value + tr) / period
+            out[i] = value
+        else:
+            value = (value * (period - 1) + tr) / period
+            out[i] = value
+    return out
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _bbands(
+    close: np.ndarray,
+    period: int,
+    nstd: float,
+    up: np.ndarray,
+    mid: np.ndarray,
+    low: np.ndarray,
+) -> None:
+    """Rolling mean/population std via a windowed Welford update."""
+    n = close.shape[0]
+    head = min(period - 1, n)
+    up[:head] = np.nan
+    mid[:head] = np.nan
+    low[:head] = np.nan
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = close[i]
+        if i < period:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            old = close[i - period]
+            delta = x - old
+            new_mean = mean + delta / period
+            m2 += delta * (x - new_mean + old - mean)
+            mean = new_mean
+        if i >= period - 1:
+            var = m2 / period
+            std = np.sqrt(var) if var > 0 else 0.0
+            mid[i] = mean
+            up[i] = mean + nstd * std
+            low[i] = mean - nstd * std
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _moments(r: np.ndarray) -> tuple[float, float, float, float]:
+    """Mean, population std, skew and excess kurtosis without temporaries."""
+    n = r.shape[0]
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    mean = 0.0
+    for i in range(n):
+        mean += r[i]
+    mean /= n
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(n):
+        d = r[i] - mean
+        d2 = d * d
+        m2 += d2
+        m3 += d2 * d
+        m4 += d2 * d2
+    var = m2 / n
+    if var <= 0:
+        return mean, 0.0, 0.0, 0.0
+    std = np.sqrt(var)
+    return mean, std, m3 / n / (var * std), m4 / n / (var * var) - 3.0
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _rolling_moments(returns: np.ndarray, window: int, out: np.ndarray) -> np.ndarray:
+    """Row ``i`` of ``out`` gets the moments of the ``window`` returns before bar ``i``."""
+    out[:] = 0.0
+    if window < 1:
+        return out
+    for idx in range(1, out.shape[0]):
+        start = idx - window if idx > window else 0
+        mean, std, skew, kurt = _moments(returns[start:idx])
+        out[idx, 0] = mean
+        out[idx, 1] = std
+        out[idx, 2] = skew
+        out[idx, 3] = kurt
+    return out
@@ -20,11 +20,43 @@ except ImportError:  # pragma: no cover - optional dependency
     DummyVecEnv = None
     VecNormalize = None
 
-from alpha_arena.rl.trading_env import TradingEnv
+from alpha_arena.rl._indicator_kernels import (
+    indicator_values,
+    new_indicator_state,
+    replay_indicators,
+    warmup_incremental,
+)
+from alpha_arena.rl.trading_env import (
+    ACCOUNT,
+    INDICATORS,
+    OBS_DTYPE,
+    OBS_SIZE,
+    PRICE_STATS,
+    RECENT_RET,
+    RECENT_VOL,
+    REGIME,
+    SIGNALS,
+    TradingEnv,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _build_regime_lut() -> Dict[str, np.ndarray]:
+    mapping = {"trend_up": 0, "trend_down": 1, "range": 2, "high_vol": 3, "low_vol": 4}
+    lut: Dict[str, np.ndarray] = {}
+    for key, idx in mapping.items():
+        one_hot = np.zeros(5, dtype=np.float32)
+        one_hot[idx] = 1.0
+        one_hot.setflags(write=False)
+        lut[key] = one_hot
+    return lut
+
+
+# Read-only one-hot vectors shared across calls; callers copy them into obs.
+_REGIME_LUT = _build_regime_lut()
+
+
 @dataclass
 class RLActionSuggestion:
     target_position: float
@@ -57,6 +89,9 @@ class RLDecisionMaker:
         self.last_prediction_time: Optional[str] = None
         self._position = 0.0
         self._equity = 0.0
+        self._obs_buf = np.zeros(OBS_SIZE, dtype=OBS_DTYPE)
+        self._ind_state = new_indicator_state()
+        self._ind_last_ts: Optional[int] = None
 
         if self.use_rl:
             self._load_model()
@@ -71,6 +106,7 @@ class RLDecisionMaker:
         try:
             self.model = PPO.load(self.model_path)
             self.model_loaded = True
+            warmup_incremental()
         except Exception as exc:  # pragma: no cover - runtime dependency
             logger.exception("Failed to load RL model: %s", exc)
             self.model_loaded = False
@@ -167,88 +203,63 @@ class RLDecisionMaker:
         self._equity = float(equity)
 
     def _construct_observation(self, market_data: Dict[str, float]) -> np.ndarray:
-        """Construct a 50-dim observation vector aligned with TradingEnv."""
+        """50-dim observation aligned with TradingEnv, built in a reused buffer.
+
+        Returns a copy so a caller holding an earlier observation is unaffected.
+        """
+        buf = self._obs_buf
+        buf.fill(0.0)
         candles = self.data_service.get_ohlcv(
             self.symbol, self.timeframe, limit=self.lookback_window
         )
         if candles.empty:
-            return np.zeros(50, dtype=np.float32)
+            return buf.copy()
 
         candles = candles.reset_index(drop=True)
+        timestamp = candles["timestamp"].astype("int64").to_numpy()
         close = candles["close"].astype(float).to_numpy()
         high = candles["high"].astype(float).to_numpy()
         low = candles["low"].astype(float).to_numpy()
         volume = candles["volume"].astype(float).fillna(0.0).to_numpy()
         returns = np.diff(close) / close[:-1] if len(close) > 1 else np.array([])
 
-        price_stats = self._price_stats(returns)
-        indicators = self._compute_indicators(close, high, low, volume)
-        signals = np.array(
-            [
-                float(market_data.get("ema_signal", 0.0)),
-                float(market_data.get("bollinger_signal", 0.0)),
-                float(market_data.get("funding_signal", 0.0)),
-            ],
-            dtype=np.float32,
+        buf[PRICE_STATS] = self._price_stats(returns)
+        buf[INDICATORS] = self._compute_indicators(timestamp, close, high, low, volume)
+        buf[SIGNALS] = (
+            float(market_data.get("ema_signal", 0.0)),
+            float(market_data.get("bollinger_signal", 0.0)),
+            float(market_data.get("funding_signal", 0.0)),
         )
-        account = np.array(
-            [
-                float(self._position),
-                float(self._equity if self._equity > 0 else 1.0),
-                float(market_data.get("drawdown", 0.0)),
-                float(market_data.get("sharpe", 0.0)),
-            ],
-            dtype=np.float32,
+        buf[ACCOUNT] = (
+            float(self._position),
+            float(self._equity if self._equity > 0 else 1.0),
+            float(market_data.get("drawdown", 0.0)),
+            float(market_data.get("sharpe", 0.0)),
         )
-        regime = self._map_regime(market_data.get("regime", "range"))
-        recent_returns = self._recent_series(returns, count=20)
-        vol_ratio = self._volume_ratio(volume)
-        recent_vol = self._recent_series(vol_ratio, count=6)
-
-        obs = np.concatenate(
-            [
-                price_stats,
-                indicators,
-                signals,
-                account,
-                regime,
-                recent_returns,
-                recent_vol,
-            ]
-        ).astype(np.float32)
-        if obs.shape[0] != 50:
-            return np.zeros(50, dtype=np.float32)
-        return obs
+        buf[REGIME] = self._map_regime(market_data.get("regime", "range"))
+        buf[RECENT_RET] = self._recent_series(returns, count=20)
+        buf[RECENT_VOL] = self._recent_series(self._volume_ratio(volume), count=6)
+        return buf.copy()
 
     def _compute_indicators(
-        self, close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray
+        self,
+        timestamp: np.ndarray,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        volume: np.ndarray,
     ) -> np.ndarray:
-        import talib
-
-        rsi = talib.RSI(close, timeperiod=14)
-        ema_fast = talib.EMA(close, timeperiod=12)
-        ema_slow = talib.EMA(close, timeperiod=26)
-        bb_upper, bb_middle, bb_lower = talib.BBANDS(
-            close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0
-        )
-        atr = talib.ATR(high, low, close, timeperiod=14)
-        vol_sma = talib.SMA(volume, timeperiod=20)
-        vol_ratio = np.where(vol_sma > 0, volume / vol_sma, 0.0)
-
-        idx = len(close) - 1
-        return np.array(
-            [
-                self._safe_value(rsi, idx),
-                self._safe_value(ema_fast, idx),
-                self._safe_value(ema_slow, idx),
-                self._safe_value(bb_upper, idx),
-                self._safe_value(bb_middle, idx),
-                self._safe_value(bb_lower, idx),
-                self._safe_value(atr, idx),
-                self._safe_value(vol_ratio, idx),
-            ],
-            dtype=np.float32,
-        )
+        """Advance the incremental indicator state by the bars not yet seen."""
+        last_ts = self._ind_last_ts
+        if last_ts is None or not timestamp[0] <= last_ts <= timestamp[-1]:
+            # No overlap with what was folded in before: rebuild from this window.
+            self._ind_state = new_indicator_state()
+            start = 0
+        else:
+            start = int(np.searchsorted(timestamp, last_ts, side="right"))
+        replay_indicators(self._ind_state, close, high, low, volume, start)
+        self._ind_last_ts = int(timestamp[-1])
+        return indicator_values(self._ind_state)
 
     def _price_stats(self, returns: np.ndarray) -> np.ndarray:
         if returns.size == 0:
@@ -280,21 +291,8 @@ class RLDecisionMaker:
             return np.zeros_like(volume, dtype=np.float32)
         return (volume / mean).astype(np.float32)
 
-    def _safe_value(self, arr: np.ndarray, idx: int) -> float:
-        if idx < 0 or idx >= len(arr):
-            return 0.0
-        value = arr[idx]
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            return 0.0
-        return float(value)
-
     def _map_regime(self, regime: str) -> np.ndarray:
-        key = (regime or "").lower()
-        mapping = {"trend_up": 0, "trend_down": 1, "range": 2, "high_vol": 3, "low_vol": 4}
-        idx = mapping.get(key, 2)
-        one_hot = np.zeros(5, dtype=np.float32)
-        one_hot[idx] = 1.0
-        return one_hot
+        return _REGIME_LUT.get((regime or "").lower(), _REGIME_LUT["range"])
 
     def _build_market_payload(self, portfolio_decision: Dict) -> Dict[str, float]:
         indicators = portfolio_decision.get("indicators", {}) or {}
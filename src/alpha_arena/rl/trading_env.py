@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
 import gymnasium as gym
 from gymnasium import spaces
+from numpy.lib.stride_tricks import sliding_window_view
 
+from alpha_arena.config import settings
 from alpha_arena.data.data_service import DataService
+from alpha_arena.rl import _indicator_kernels as kernels
+from alpha_arena.utils._njit import NUMBA_AVAILABLE
 
 try:
     import talib
@@ -21,6 +26,51 @@ except ImportError as exc:  # pragma: no cover - handled at runtime
 else:
     _TALIB_IMPORT_ERROR = None
 
+# Observation layout.
+OBS_DTYPE = np.float32
+OBS_SIZE = 50
+PRICE_STATS = slice(0, 4)
+INDICATORS = slice(4, 12)
+SIGNALS = slice(12, 15)
+ACCOUNT = slice(15, 19)
+REGIME = slice(19, 24)
+RECENT_RET = slice(24, 44)
+RECENT_VOL = slice(44, 50)
+
+# Space checks scan every observation, so they only run when debugging.
+_VALIDATE = settings.env_validate
+
+# Per-bar arrays published to worker envs by ``TradingEnv.publish_shared``.
+SHARED_ARRAYS = (
+    "_close",
+    "_open",
+    "_high",
+    "_low",
+    "_volume",
+    "_timestamp",
+    "_rsi",
+    "_ema_fast",
+    "_ema_slow",
+    "_bb_upper",
+    "_bb_middle",
+    "_bb_lower",
+    "_atr",
+    "_vol_ratio",
+    "_funding_arr",
+    "_obs_mat",
+)
+_CONFIG_FIELDS = (
+    "symbol",
+    "timeframe",
+    "initial_equity",
+    "max_position",
+    "lookback_window",
+    "transaction_fee",
+)
+
+# Blocks created in this process, kept open until ``release_shared``.
+_PUBLISHED: dict[str, SharedMemory] = {}
+
 
 @dataclass
 class TradingEnvState:
@@ -38,6 +88,7 @@ class TradingEnv(gym.Env):
     """RL trading environment with indicator-driven observations."""
 
     metadata = {"render_modes": []}
+    _warmed = False
 
     def __init__(
         self,
@@ -50,65 +101,146 @@ class TradingEnv(gym.Env):
         data_service: Optional[DataService] = None,
         data_limit: Optional[int] = None,
     ) -> None:
-        if talib is None:
+        if not NUMBA_AVAILABLE and talib is None:
             raise ImportError(
-                "talib is required for TradingEnv. Install TA-Lib before use."
+                "numba or talib is required for TradingEnv. Install one before use."
             ) from _TALIB_IMPORT_ERROR
 
         super().__init__()
-
-        self.symbol = symbol
-        self.timeframe = timeframe
-        self.initial_equity = float(initial_equity)
-        self.max_position = float(max_position)
-        self.lookback_window = int(lookback_window)
-        self.transaction_fee = float(transaction_fee)
+        self.warmup()
+
+        self._configure(
+            symbol,
+            timeframe,
+            initial_equity,
+            max_position,
+            lookback_window,
+            transaction_fee,
+        )
         self.data_service = data_service or DataService()
 
         limit = int(data_limit or 5000)
         if limit < self.lookback_window + 2:
             limit = self.lookback_window + 2
 
-        self._candles = self.data_service.get_ohlcv(
-            self.symbol, self.timeframe, limit=limit
-        )
-        if self._candles.empty:
+        candles = self.data_service.get_ohlcv(self.symbol, self.timeframe, limit=limit)
+        if candles.empty:
             raise ValueError("No candle data available for TradingEnv.")
 
-        self._candles = self._candles.reset_index(drop=True)
-        self._close = self._candles["close"].astype(float).to_numpy()
-        self._open = self._candles["open"].astype(float).to_numpy()
-        self._high = self._candles["high"].astype(float).to_numpy()
-        self._low = self._candles["low"].astype(float).to_numpy()
-        self._volume = self._candles["volume"].astype(float).fillna(0.0).to_numpy()
-        self._timestamp = self._candles["timestamp"].astype(int).to_numpy()
-
-        self._rsi = talib.RSI(self._close, timeperiod=14)
-        self._ema_fast = talib.EMA(self._close, timeperiod=12)
-        self._ema_slow = talib.EMA(self._close, timeperiod=26)
-        bb_upper, bb_middle, bb_lower = talib.BBANDS(
-            self._close, timeperiod=20, nbdevup=2, nbdevdn=2, matype=0
+        # Own contiguous copies so no column view pins the frame's blocks.
+        self._close = candles["close"].to_numpy(dtype=np.float64, copy=True)
+        self._open = candles["open"].to_numpy(dtype=np.float64, copy=True)
+        self._high = candles["high"].to_numpy(dtype=np.float64, copy=True)
+        self._low = candles["low"].to_numpy(dtype=np.float64, copy=True)
+        self._volume = (
+            candles["volume"].fillna(0.0).to_numpy(dtype=np.float64, copy=True)
         )
-        self._bb_upper = bb_upper
-        self._bb_middle = bb_middle
-        self._bb_lower = bb_lower
-        self._atr = talib.ATR(self._high, self._low, self._close, timeperiod=14)
-        vol_sma = talib.SMA(self._volume, timeperiod=20)
-        self._vol_ratio = np.where(vol_sma > 0, self._volume / vol_sma, 0.0)
+        self._timestamp = candles["timestamp"].to_numpy(dtype=np.int64, copy=True)
 
-        self._funding = self._load_funding_series()
+        self._compute_indicators()
+        vol_sma = self._vol_sma
+        self._vol_ratio = np.where(vol_sma > 0, self._volume / vol_sma, 0.0)
+        # Zero the lookback warm-up once so features can be indexed directly.
+        for series in (
+            self._rsi,
+            self._ema_fast,
+            self._ema_slow,
+            self._bb_upper,
+            self._bb_middle,
+            self._bb_lower,
+            self._atr,
+            self._vol_ratio,
+        ):
+            np.nan_to_num(series, nan=0.0, copy=False)
+
+        self._funding_arr = self._load_funding_series()
+        self._obs_mat = self._build_observation_matrix()
+        self._init_runtime()
+
+    @classmethod
+    def warmup(cls) -> None:
+        """Compile the numba kernels once per process before the first env builds."""
+        if cls._warmed or not NUMBA_AVAILABLE:
+            return
+        kernels.warmup()
+        TradingEnv._warmed = True
+
+    @classmethod
+    def publish_shared(cls, **env_kwargs: Any) -> dict[str, Any]:
+        """Build one env and copy its arrays into shared memory for worker envs.
+
+        Pass the returned handles to :meth:`from_shared` in each worker and
+        to :meth:`release_shared` once the workers are done.
+        """
+        env = cls(**env_kwargs)
+        arrays: dict[str, tuple[str, tuple[int, ...], str]] = {}
+        for attr in SHARED_ARRAYS:
+            src = np.ascontiguousarray(getattr(env, attr))
+            block = SharedMemory(create=True, size=max(src.nbytes, 1))
+            np.ndarray(src.shape, dtype=src.dtype, buffer=block.buf)[...] = src
+            _PUBLISHED[block.name] = block
+            arrays[attr] = (block.name, src.shape, src.dtype.str)
+        config = {field: getattr(env, field) for field in _CONFIG_FIELDS}
+        return {"config": config, "arrays": arrays}
+
+    @classmethod
+    def from_shared(cls, handles: dict[str, Any]) -> "TradingEnv":
+        """Create an env over read-only views of arrays from :meth:`publish_shared`."""
+        env = cls.__new__(cls)
+        gym.Env.__init__(env)
+        env._configure(**handles["config"])
+        env.data_service = None
+        # Views are only valid while their blocks stay referenced.
+        env._shm_blocks = []
+        for attr, (name, shape, dtype) in handles["arrays"].items():
+            block = SharedMemory(name=name)
+            view = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            view.flags.writeable = False
+            setattr(env, attr, view)
+            env._shm_blocks.append(block)
+        env._init_runtime()
+        return env
+
+    @staticmethod
+    def release_shared(handles: dict[str, Any]) -> None:
+        """Unlink shared blocks created by :meth:`publish_shared` in this process."""
+        for name, _, _ in handles["arrays"].values():
+            block = _PUBLISHED.pop(name, None)
+            if block is not None:
+                block.close()
+                block.unlink()
+
+    def _configure(
+        self,
+        symbol: str,
+        timeframe: str,
+        initial_equity: float,
+        max_position: float,
+        lookback_window: int,
+        transaction_fee: float,
+    ) -> None:
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.initial_equity = float(initial_equity)
+        self.max_position = float(max_position)
+        self.lookback_window = int(lookback_window)
+        self.transaction_fee = float(transaction_fee)
 
+    def _init_runtime(self) -> None:
         self.action_space = spaces.Box(
             low=np.array([-1.0, 0.0, 0.0, 0.0], dtype=np.float32),
             high=np.array([1.0, 1.0, 1.0, 1.0], dtype=np.float32),
             dtype=np.float32,
         )
         self.observation_space = spaces.Box(
-            low=-np.inf, high=np.inf, shape=(50,), dtype=np.float32
+            low=-np.inf, high=np.inf, shape=(OBS_SIZE,), dtype=OBS_DTYPE
         )
+        self._obs_buf = np.empty(OBS_SIZE, dtype=OBS_DTYPE)
 
         self._index = self.lookback_window
-        self._returns: list[float] = []
+        self._ret_sum = 0.0
+        self._ret_sq = 0.0
+        self._ret_n = 0
         self._state = TradingEnvState(
             equity=self.initial_equity,
             max_equity=self.initial_equity,
@@ -121,7 +253,9 @@ class TradingEnv(gym.Env):
     def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
         super().reset(seed=seed)
         self._index = self.lookback_window
-        self._returns = []
+        self._ret_sum = 0.0
+        self._ret_sq = 0.0
+        self._ret_n = 0
         self._state = TradingEnvState(
             equity=self.initial_equity,
             max_equity=self.initial_equity,
@@ -130,12 +264,21 @@ class TradingEnv(gym.Env):
             sharpe=0.0,
             step_return=0.0,
         )
-        return self._get_observation(), {}
+        obs = self._get_observation()
+        if _VALIDATE:
+            self._validate_observation(obs)
+        return obs, {}
 
     def step(self, action: np.ndarray):
-        action = np.asarray(action, dtype=np.float32)
-        if action.shape != (4,):
-            raise ValueError(f"Action must be shape (4,), got {action.shape}.")
+        # Policies already emit float32 (4,) arrays; only convert other inputs.
+        if not (
+            isinstance(action, np.ndarray)
+            and action.dtype == np.float32
+            and action.shape == (4,)
+        ):
+            action = np.asarray(action, dtype=np.float32)
+            if action.shape != (4,):
+                raise ValueError(f"Action must be shape (4,), got {action.shape}.")
 
         target_position = float(np.clip(action[0], -1.0, 1.0))
         weights = np.clip(action[1:], 0.0, 1.0)
@@ -150,7 +293,7 @@ class TradingEnv(gym.Env):
         turnover = abs(new_position - current_position)
 
         if self._index >= len(self._close) - 1:
-            return self._get_observation(), 0.0, True, False, {}
+            return self._get_observation().copy(), 0.0, True, False, {}
 
         prev_equity = self._state.equity
         price = self._close[self._index]
@@ -162,8 +305,10 @@ class TradingEnv(gym.Env):
         equity = max(prev_equity + pnl - fee_cost, 0.0)
 
         step_return = (equity - prev_equity) / prev_equity if prev_equity > 0 else 0.0
-        self._returns.append(step_return)
-        sharpe = self._compute_sharpe(self._returns)
+        self._ret_sum += step_return
+        self._ret_sq += step_return * step_return
+        self._ret_n += 1
+        sharpe = self._compute_sharpe()
 
         max_equity = max(self._state.max_equity, equity)
         drawdown = (max_equity - equity) / max_equity if max_equity > 0 else 0.0
@@ -195,185 +340,180 @@ class TradingEnv(gym.Env):
             "sharpe": sharpe,
             "turnover": turnover,
             "step_return": step_return,
-            "weights": weights.tolist(),
+            "weights": weights,
             "position": new_position,
             "timestamp": int(self._timestamp[self._index]),
         }
-        return self._get_observation(), float(reward), terminated, False, info
+        obs = self._get_observation()
+        if _VALIDATE:
+            self._validate_observation(obs)
+        if terminated:
+            # Vector wrappers keep this one in ``info["terminal_observation"]``
+            # and reset right after, which would overwrite the shared buffer.
+            obs = obs.copy()
+        return obs, float(reward), terminated, False, info
 
     def _get_observation(self) -> np.ndarray:
-        idx = self._index
-        start = max(0, idx - self.lookback_window + 1)
-        window_prices = self._close[start : idx + 1]
-        returns = np.diff(window_prices) / window_prices[:-1] if len(window_prices) > 1 else np.array([])
-
-        price_stats = self._price_stats(returns)
-        tech_values = self._indicator_values(idx)
-        signal_values = self._strategy_signals(idx)
-        account_values = self._account_features()
-        regime_one_hot = self._market_regime(idx)
-        recent_returns = self._recent_returns(returns, count=20)
-        recent_vol_ratio = self._recent_vol_ratio(idx, count=6)
-
-        features = np.concatenate(
-            [
-                price_stats,
-                tech_values,
-                signal_values,
-                account_values,
-                regime_one_hot,
-                recent_returns,
-                recent_vol_ratio,
-            ]
-        ).astype(np.float32)
-
-        if features.shape[0] != 50:
-            raise ValueError(f"Observation size mismatch: {features.shape[0]} != 50")
-        return features
-
-    def _price_stats(self, returns: np.ndarray) -> np.ndarray:
-        if returns.size == 0:
-            return np.zeros(4, dtype=np.float32)
-        mean = float(np.mean(returns))
-        std = float(np.std(returns)) if returns.size > 1 else 0.0
-        if std <= 0:
-            return np.array([mean, std, 0.0, 0.0], dtype=np.float32)
-        normalized = (returns - mean) / std
-        skew = float(np.mean(normalized**3))
-        kurt = float(np.mean(normalized**4) - 3.0)
-        return np.array([mean, std, skew, kurt], dtype=np.float32)
-
-    def _indicator_values(self, idx: int) -> np.ndarray:
-        rsi = self._safe_value(self._rsi, idx)
-        ema_fast = self._safe_value(self._ema_fast, idx)
-        ema_slow = self._safe_value(self._ema_slow, idx)
-        bb_upper = self._safe_value(self._bb_upper, idx)
-        bb_middle = self._safe_value(self._bb_middle, idx)
-        bb_lower = self._safe_value(self._bb_lower, idx)
-        atr = self._safe_value(self._atr, idx)
-        vol_ratio = self._safe_value(self._vol_ratio, idx)
-        return np.array(
-            [rsi, ema_fast, ema_slow, bb_upper, bb_middle, bb_lower, atr, vol_ratio],
-            dtype=np.float32,
+        """Fill the reused observation buffer; callers keeping it must copy."""
+        obs = self._obs_buf
+        obs[:] = self._obs_mat[self._index]
+        obs[ACCOUNT] = self._account_features()
+        return obs
+
+    def _validate_observation(self, obs: np.ndarray) -> None:
+        if not self.observation_space.contains(obs):
+            raise ValueError(
+                f"Observation at index {self._index} is outside the observation space."
+            )
+
+    def _build_observation_matrix(self) -> np.ndarray:
+        """Market features for every bar; account columns are filled per step."""
+        total = len(self._close)
+        obs = np.zeros((total, OBS_SIZE), dtype=OBS_DTYPE)
+        returns = np.diff(self._close) / self._close[:-1]
+
+        obs[:, PRICE_STATS] = self._price_stats_matrix(returns)
+        self._recent_returns_matrix(returns, obs[:, RECENT_RET])
+        self._recent_vol_ratio_matrix(obs[:, RECENT_VOL])
+
+        rsi, atr, vol_ratio = self._rsi, self._atr, self._vol_ratio
+        ema_fast, ema_slow = self._ema_fast, self._ema_slow
+        bb_upper, bb_middle, bb_lower = self._bb_upper, self._bb_middle, self._bb_lower
+        obs[:, INDICATORS] = np.column_stack(
+            [rsi, ema_fast, ema_slow, bb_upper, bb_middle, bb_lower, atr, vol_ratio]
         )
 
-    def _strategy_signals(self, idx: int) -> np.ndarray:
-        ema_fast = self._safe_value(self._ema_fast, idx)
-        ema_slow = self._safe_value(self._ema_slow, idx)
-        ema_signal = np.sign(ema_fast - ema_slow)
-
-        close = self._close[idx]
-        bb_upper = self._safe_value(self._bb_upper, idx)
-        bb_lower = self._safe_value(self._bb_lower, idx)
-        if close < bb_lower:
-            bollinger_signal = 1.0
-        elif close > bb_upper:
-            bollinger_signal = -1.0
-        else:
-            bollinger_signal = 0.0
-
-        funding_rate = self._funding.get(idx, 0.0)
-        if funding_rate > 0:
-            funding_signal = -1.0
-        elif funding_rate < 0:
-            funding_signal = 1.0
-        else:
-            funding_signal = 0.0
-
-        return np.array([ema_signal, bollinger_signal, funding_signal], dtype=np.float32)
-
-    def _account_features(self) -> np.ndarray:
-        return np.array(
+        close = self._close
+        obs[:, SIGNALS] = np.column_stack(
             [
-                self._state.position / max(self.max_position, 1e-6),
-                self._state.equity / max(self.initial_equity, 1e-6),
-                self._state.drawdown,
-                self._state.sharpe,
-            ],
-            dtype=np.float32,
+                np.sign(ema_fast - ema_slow),
+                np.where(close < bb_lower, 1.0, np.where(close > bb_upper, -1.0, 0.0)),
+                -np.sign(self._funding_arr),
+            ]
         )
 
-    def _market_regime(self, idx: int) -> np.ndarray:
-        ema_fast = self._safe_value(self._ema_fast, idx)
-        ema_slow = self._safe_value(self._ema_slow, idx)
-        atr = self._safe_value(self._atr, idx)
-        price = self._close[idx]
-        volatility = atr / price if price > 0 else 0.0
-        trend_strength = abs(ema_fast - ema_slow) / price if price > 0 else 0.0
-        bb_width = 0.0
-        bb_middle = self._safe_value(self._bb_middle, idx)
-        if bb_middle > 0:
-            bb_width = (self._safe_value(self._bb_upper, idx) - self._safe_value(self._bb_lower, idx)) / bb_middle
-
-        if trend_strength > 0.002 and ema_fast > ema_slow:
-            regime = 0  # trend_up
-        elif trend_strength > 0.002 and ema_fast < ema_slow:
-            regime = 1  # trend_down
-        elif volatility > 0.02:
-            regime = 3  # high_vol
-        elif volatility < 0.005:
-            regime = 4  # low_vol
-        else:
-            regime = 2  # range
-
-        one_hot = np.zeros(5, dtype=np.float32)
-        one_hot[regime] = 1.0
-        return one_hot
-
-    def _recent_returns(self, returns: np.ndarray, count: int) -> np.ndarray:
-        if returns.size == 0:
-            return np.zeros(count, dtype=np.float32)
-        pad = max(0, count - returns.size)
-        recent = returns[-count:] if returns.size >= count else returns
-        if pad:
-            recent = np.concatenate([np.zeros(pad), recent])
-        return recent.astype(np.float32)
-
-    def _recent_vol_ratio(self, idx: int, count: int) -> np.ndarray:
-        start = max(0, idx - count + 1)
-        values = self._vol_ratio[start : idx + 1]
-        pad = max(0, count - len(values))
-        if pad:
-            values = np.concatenate([np.zeros(pad), values])
-        return values.astype(np.float32)
-
-    def _safe_value(self, arr: np.ndarray, idx: int) -> float:
-        if idx < 0 or idx >= len(arr):
-            return 0.0
-        value = arr[idx]
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            return 0.0
-        return float(value)
+        safe_close = np.where(close > 0, close, 1.0)
+        volatility = np.where(close > 0, atr / safe_close, 0.0)
+        trend_strength = np.where(close > 0, np.abs(ema_fast - ema_slow) / safe_close, 0.0)
+        trending = trend_strength > 0.002
+        # Codes: 0 trend_up, 1 trend_down, 2 range, 3 high_vol, 4 low_vol.
+        regime = np.where(
+            trending & (ema_fast > ema_slow),
+            0,
+            np.where(
+                trending & (ema_fast < ema_slow),
+                1,
+                np.where(volatility > 0.02, 3, np.where(volatility < 0.005, 4, 2)),
+            ),
+        )
+        obs[np.arange(total), REGIME.start + regime] = 1.0
+        return obs
+
+    def _price_stats_matrix(self, returns: np.ndarray) -> np.ndarray:
+        """Mean/std/skew/kurt of the returns visible in each bar's lookback window."""
+        stats = np.empty((returns.size + 1, 4), dtype=np.float64)
+        return kernels._rolling_moments(returns, self.lookback_window - 1, stats)
+
+    def _recent_returns_matrix(self, returns: np.ndarray, out: np.ndarray) -> None:
+        """Write the last window returns per bar into ``out``, left-padded with zeros."""
+        count = out.shape[1]
+        padded = np.concatenate([np.zeros(count), returns])
+        out[:] = sliding_window_view(padded, count)
+        # The padding already covers early bars; a short lookback hides older columns.
+        visible = max(self.lookback_window - 1, 0)
+        if visible < count:
+            out[:, : count - visible] = 0.0
+
+    def _recent_vol_ratio_matrix(self, out: np.ndarray) -> None:
+        count = out.shape[1]
+        padded = np.concatenate([np.zeros(count - 1), self._vol_ratio])
+        out[:] = sliding_window_view(padded, count)
+
+    def _account_features(self) -> tuple[float, float, float, float]:
+        return (
+            self._state.position / max(self.max_position, 1e-6),
+            self._state.equity / max(self.initial_equity, 1e-6),
+            self._state.drawdown,
+            self._state.sharpe,
+        )
 
-    def _compute_sharpe(self, returns: list[float]) -> float:
-        if len(returns) < 2:
+    def _compute_sharpe(self) -> float:
+        """Annualized Sharpe of episode step returns from running sums, O(1)."""
+        n = self._ret_n
+        if n < 2:
             return 0.0
-        arr = np.array(returns, dtype=np.float32)
-        mean = float(np.mean(arr))
-        std = float(np.std(arr))
-        if std <= 0:
+        mean = self._ret_sum / n
+        var = self._ret_sq / n - mean * mean
+        if var <= 0:
             return 0.0
-        return mean / std * np.sqrt(252.0)
+        return mean / np.sqrt(var) * np.sqrt(252.0)
 
     def _concentration_penalty(self, weights: np.ndarray) -> float:
         max_weight = float(np.max(weights)) if weights.size else 0.0
         return max(0.0, max_weight - 1 / 3)
 
-    def _load_funding_series(self) -> Dict[int, float]:
-        series: Dict[int, float] = {}
+    def _compute_indicators(self) -> None:
+        """Fill indicator series with numba kernels, or TA-Lib without numba."""
+        close, high, low = self._close, self._high, self._low
+        if NUMBA_AVAILABLE:
+            self._rsi = kernels._rsi(close, kernels.RSI_PERIOD, np.empty_like(close))
+            self._ema_fast = kernels._ema(
+                close, kernels.EMA_FAST_PERIOD, np.empty_like(close)
+            )
+            self._ema_slow = kernels._ema(
+                close, kernels.EMA_SLOW_PERIOD, np.empty_like(close)
+            )
+            self._bb_upper = np.empty_like(close)
+            self._bb_middle = np.empty_like(close)
+            self._bb_lower = np.empty_like(close)
+            kernels._bbands(
+                close,
+                kernels.BB_PERIOD,
+                kernels.BB_NSTD,
+                self._bb_upper,
+                self._bb_middle,
+                self._bb_lower,
+            )
+            self._atr = kernels._atr(
+                high, low, close, kernels.ATR_PERIOD, np.empty_like(close)
+            )
+            self._vol_sma = kernels._sma(
+                self._volume, kernels.VOL_PERIOD, np.empty_like(close)
+            )
+            return
+
+        self._rsi = talib.RSI(close, timeperiod=kernels.RSI_PERIOD)
+        self._ema_fast = talib.EMA(close, timeperiod=kernels.EMA_FAST_PERIOD)
+        self._ema_slow = talib.EMA(close, timeperiod=kernels.EMA_SLOW_PERIOD)
+        self._bb_upper, self._bb_middle, self._bb_lower = talib.BBANDS(
+            close,
+            timeperiod=kernels.BB_PERIOD,
+            nbdevup=kernels.BB_NSTD,
+            nbdevdn=kernels.BB_NSTD,
+            matype=0,
+        )
+        self._atr = talib.ATR(high, low, close, timeperiod=kernels.ATR_PERIOD)
+        self._vol_sma = talib.SMA(self._volume, timeperiod=kernels.VOL_PERIOD)
+
+    def _load_funding_series(self) -> np.ndarray:
+        """Funding rate in effect at each candle, aligned with ``self._timestamp``."""
+        series = np.zeros(len(self._timestamp), dtype=np.float32)
         try:
             funding = self.data_service.get_funding_history(self.symbol, limit=5000)
         except Exception:
             return series
         if funding.empty:
             return series
-        funding = funding.sort_values("timestamp").reset_index(drop=True)
-        fund_idx = 0
-        current_rate = 0.0
-        for idx, ts in enumerate(self._timestamp):
-            while fund_idx < len(funding) and funding.loc[fund_idx, "timestamp"] <= ts:
-                current_rate = float(funding.loc[fund_idx, "funding_rate"] or 0.0)
-                fund_idx += 1
-            series[idx] = current_rate
-        return series
+        funding = funding.sort_values("timestamp", kind="stable")
+        fund_ts = funding["timestamp"].to_numpy(dtype=np.int64)
+        rates = (
+            pd.to_numeric(funding["funding_rate"], errors="coerce")
+            .fillna(0.0)
+            .to_numpy(dtype=np.float32)
+        )
+        pos = np.searchsorted(fund_ts, self._timestamp, side="right") - 1
+        return np.where(pos >= 0, rates[np.clip(pos, 0, None)], 0.0).astype(np.float32)
+
 
+if settings.jit_warmup:
+    TradingEnv.warmup()
@@ -0,0 +1,180 @@
+"""Vectorized multi-copy TradingEnv for batched RL rollouts."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from gymnasium.vector import VectorEnv
+from gymnasium.vector.utils import batch_space
+
+from alpha_arena.rl.trading_env import ACCOUNT, TradingEnv
+
+try:
+    from gymnasium.vector import AutoresetMode
+except ImportError:  # pragma: no cover - gymnasium < 1.1
+    AutoresetMode = None
+
+_SQRT_252 = np.sqrt(252.0)
+
+
+class BatchedTradingEnv(VectorEnv):
+    """Run ``num_envs`` TradingEnv copies over shared data with NumPy batch ops.
+
+    Market features come from the env's precomputed observation matrix;
+    per-env account state lives in length-N arrays. Finished envs are
+    reset in the same step, and their last observation is reported in
+    ``infos["final_obs"]``.
+    """
+
+    def __init__(self, num_envs: int = 16, **env_kwargs: Any) -> None:
+        self._env = TradingEnv(**env_kwargs)
+        self.num_envs = int(num_envs)
+        self.single_observation_space = self._env.observation_space
+        self.single_action_space = self._env.action_space
+        self.observation_space = batch_space(self.single_observation_space, self.num_envs)
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        self.metadata = dict(self._env.metadata)
+        if AutoresetMode is not None:
+            self.metadata["autoreset_mode"] = AutoresetMode.SAME_STEP
+
+        env = self._env
+        self._close = env._close
+        self._timestamp = env._timestamp
+        self._last_index = len(self._close) - 1
+        self._start_index = env.lookback_window
+        self._initial_equity = env.initial_equity
+        self._max_position = env.max_position
+        self._transaction_fee = env.transaction_fee
+        self._market_obs = env._obs_mat
+
+        n = self.num_envs
+        self._index = np.full(n, self._start_index, dtype=np.int64)
+        self._equity = np.full(n, self._initial_equity, dtype=np.float64)
+        self._max_equity = self._equity.copy()
+        self._position = np.zeros(n, dtype=np.float64)
+        self._drawdown = np.zeros(n, dtype=np.float64)
+        self._sharpe = np.zeros(n, dtype=np.float64)
+        self._ret_sum = np.zeros(n, dtype=np.float64)
+        self._ret_sq = np.zeros(n, dtype=np.float64)
+        self._ret_n = np.zeros(n, dtype=np.int64)
+
+    def _reset_mask(self, mask: np.ndarray) -> None:
+        self._index[mask] = self._start_index
+        self._equity[mask] = self._initial_equity
+        self._max_equity[mask] = self._initial_equity
+        self._position[mask] = 0.0
+        self._drawdown[mask] = 0.0
+        self._sharpe[mask] = 0.0
+        self._ret_sum[mask] = 0.0
+        self._ret_sq[mask] = 0.0
+        self._ret_n[mask] = 0
+
+    def _observations(self) -> np.ndarray:
+        obs = self._market_obs[self._index]
+        account = obs[:, ACCOUNT]
+        account[:, 0] = self._position / max(self._max_position, 1e-6)
+        account[:, 1] = self._equity / max(self._initial_equity, 1e-6)
+        account[:, 2] = self._drawdown
+        account[:, 3] = self._sharpe
+        return obs
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        if seed is not None:
+            self._env.reset(seed=seed)
+        mask = (options or {}).get("reset_mask")
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+        self._reset_mask(np.asarray(mask, dtype=bool))
+        return self._observations(), {}
+
+    def step(self, actions: np.ndarray):
+        actions = np.asarray(actions, dtype=np.float32)
+        if actions.shape != (self.num_envs, 4):
+            raise ValueError(
+                f"Actions must be shape ({self.num_envs}, 4), got {actions.shape}."
+            )
+
+        target_position = np.clip(actions[:, 0], -1.0, 1.0)
+        weights = np.clip(actions[:, 1:], 0.0, 1.0)
+        weight_sum = weights.sum(axis=1, keepdims=True)
+        weights = np.where(
+            weight_sum > 0,
+            weights / np.where(weight_sum > 0, weight_sum, 1.0),
+            np.float32(1 / 3),
+        ).astype(np.float32)
+
+        new_position = target_position.astype(np.float64) * self._max_position
+        turnover = np.abs(new_position - self._position)
+
+        prev_equity = self._equity
+        price = self._close[self._index]
+        next_price = self._close[self._index + 1]
+        safe_price = np.where(price > 0, price, 1.0)
+        price_return = np.where(price > 0, (next_price - price) / safe_price, 0.0)
+
+        fee_cost = turnover * prev_equity * self._transaction_fee
+        pnl = new_position * prev_equity * price_return
+        equity = np.maximum(prev_equity + pnl - fee_cost, 0.0)
+
+        safe_prev = np.where(prev_equity > 0, prev_equity, 1.0)
+        step_return = np.where(prev_equity > 0, (equity - prev_equity) / safe_prev, 0.0)
+
+        self._ret_sum += step_return
+        self._ret_sq += step_return * step_return
+        self._ret_n += 1
+        count = np.maximum(self._ret_n, 1)
+        mean = self._ret_sum / count
+        var = np.maximum(self._ret_sq / count - mean * mean, 0.0)
+        std = np.sqrt(var)
+        sharpe = np.where(
+            (self._ret_n >= 2) & (std > 0),
+            mean / np.where(std > 0, std, 1.0) * _SQRT_252,
+            0.0,
+        )
+
+        max_equity = np.maximum(self._max_equity, equity)
+        drawdown = np.where(
+            max_equity > 0, (max_equity - equity) / np.where(max_equity > 0, max_equity, 1.0), 0.0
+        )
+
+        concentration_penalty = np.maximum(weights.max(axis=1) - 1 / 3, 0.0)
+        rewards = (
+            step_return * 100.0
+            + sharpe * 0.1
+            - drawdown * 10.0
+            - turnover * 0.01
+            - concentration_penalty * 0.1
+        ).astype(np.float32)
+
+        self._equity = equity
+        self._max_equity = max_equity
+        self._position = new_position
+        self._drawdown = drawdown
+        self._sharpe = sharpe
+        self._index += 1
+
+        terminated = self._index >= self._last_index
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        # State arrays are reset in place below, so report copies.
+        infos: Dict[str, Any] = {
+            "equity": equity.copy(),
+            "drawdown": drawdown.copy(),
+            "sharpe": sharpe.copy(),
+            "turnover": turnover,
+            "step_return": step_return,
+            "weights": weights,
+            "position": new_position.copy(),
+            "timestamp": self._timestamp[self._index],
+        }
+
+        obs = self._observations()
+        if terminated.any():
+            infos["final_obs"] = obs.copy()
+            self._reset_mask(terminated)
+            obs[terminated] = self._observations()[terminated]
+        return obs, rewards, terminated, truncated, infos
+
+    def close_extras(self, **kwargs: Any) -> None:
+        self._env.close()
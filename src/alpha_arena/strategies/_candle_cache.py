@@ -0,0 +1,74 @@
+"""Candle frames shared by every strategy on the same market."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Distinct (symbol, timeframe, limit) windows kept per data service.
+_MAX_ENTRIES = 64
+
+_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+
+class CandleColumns(dict):
+    """Read-only NumPy columns of one candle ``frame``, converted on first access."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        super().__init__()
+        self.frame = frame
+
+    def __missing__(self, column: str) -> np.ndarray:
+        series = self.frame[column]
+        if column == "timestamp":
+            values = series.to_numpy(dtype=np.int64)
+        else:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        values.flags.writeable = False
+        self[column] = values
+        return values
+
+
+def _entries(data_service: Any) -> "OrderedDict[Tuple[str, str, int], Any] | None":
+    try:
+        return _CACHE.setdefault(data_service, OrderedDict())
+    except TypeError:  # not weak-referenceable
+        return None
+
+
+def load_ohlcv(data_service: Any, symbol: str, timeframe: str, limit: int) -> CandleColumns:
+    """``data_service.get_ohlcv`` reused until the stored candles change.
+
+    Entries are keyed on ``get_candle_version`` for the same window (newest and
+    oldest timestamp, row count), so a new candle or a bar backfilled into the
+    window invalidates them. Services without that method (backtest feeds, stubs) are not cached.
+    The returned frame is shared and must not be mutated.
+    """
+    candle_version = getattr(data_service, "get_candle_version", None)
+    version = candle_version(symbol, timeframe, limit) if candle_version is not None else None
+    if version is None:
+        return CandleColumns(data_service.get_ohlcv(symbol, timeframe, limit=limit))
+
+    key = (symbol, timeframe, limit)
+    with _LOCK:
+        entries = _entries(data_service)
+        hit = entries.get(key) if entries is not None else None
+        if hit is not None and hit[0] == version:
+            entries.move_to_end(key)
+            return hit[1]
+
+    columns = CandleColumns(data_service.get_ohlcv(symbol, timeframe, limit=limit))
+    if entries is not None and not columns.frame.empty:
+        # A write landing after the probe only makes the next call refetch.
+        with _LOCK:
+            entries[key] = (version, columns)
+            entries.move_to_end(key)
+            while len(entries) > _MAX_ENTRIES:
+                entries.popitem(last=False)
+    return columns
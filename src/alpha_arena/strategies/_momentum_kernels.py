@@ -0,0 +1,152 @@
+"""Numba kernel for MomentumStrategy's last-bar statistics."""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from alpha_arena.config import settings
+from alpha_arena.utils._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _nan_max(a: float, b: float) -> float:
+    # NaN-skipping max, like np.fmax.
+    if np.isnan(a):
+        return b
+    if np.isnan(b):
+        return a
+    return max(a, b)
+
+
+@njit(cache=True)
+def _rsi_at(close: np.ndarray, end: int, period: int) -> float:
+    """Simple-mean RSI of :func:`indicators.rsi` at ``close[end]``; 0.0 if undefined."""
+    if end - period < 0:
+        return 0.0
+    gain = 0.0
+    loss = 0.0
+    for k in range(end - period + 1, end + 1):
+        delta = close[k] - close[k - 1]
+        if np.isnan(delta):
+            return 0.0
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+    if loss == 0:
+        return 0.0
+    return 100 - 100 / (1 + (gain / period) / (loss / period))
+
+
+@njit(cache=True)
+def _add_delta(gain: float, loss: float, delta: float) -> Tuple[float, float]:
+    # A NaN delta lands in ``loss`` and marks the window undefined.
+    if delta > 0:
+        return gain + delta, loss
+    return gain, loss - delta
+
+
+@njit(cache=True)
+def _rsi_from_sums(gain: float, loss: float, period: int) -> float:
+    if np.isnan(loss) or loss == 0:
+        return 0.0
+    return 100 - 100 / (1 + (gain / period) / (loss / period))
+
+
+@njit(cache=True)
+def _rsi_pair(close: np.ndarray, end: int, period: int) -> Tuple[float, float]:
+    """RSI at ``close[end - 1]`` and ``close[end]`` from one pass over the deltas.
+
+    The two windows share ``period - 1`` deltas, which are summed once.
+    """
+    if end - 1 - period < 0:
+        return 0.0, _rsi_at(close, end, period)
+    gain = 0.0
+    loss = 0.0
+    for k in range(end - period + 1, end):
+        gain, loss = _add_delta(gain, loss, close[k] - close[k - 1])
+    prev_gain, prev_loss = _add_delta(gain, loss, close[end - period] - close[end - period - 1])
+    last_gain, last_loss = _add_delta(gain, loss, close[end] - close[end - 1])
+    return (
+        _rsi_from_sums(prev_gain, prev_loss, period),
+        _rsi_from_sums(last_gain, last_loss, period),
+    )
+
+
+@njit(cache=True)
+def _rsi_momentum_pair(
+    close: np.ndarray, end: int, momentum_period: int, rsi_period: int
+) -> Tuple[float, float]:
+    """RSI momentum at ``end - 1`` and ``end``; 0.0 without a usable base."""
+    base_prev, base = _rsi_pair(close, end - momentum_period, rsi_period)
+    rsi_prev, rsi = _rsi_pair(close, end, rsi_period)
+    mom_prev = (rsi_prev - base_prev) / base_prev * 100 if base_prev != 0 else 0.0
+    mom = (rsi - base) / base * 100 if base != 0 else 0.0
+    return mom_prev, mom
+
+
+@njit(cache=True, error_model="numpy")
+def momentum_stats(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray,
+    momentum_period: int,
+    rsi_period: int,
+    atr_period: int,
+) -> Tuple[float, float, float, float, float, float]:
+    """(price_mom_prev, price_mom, rsi_mom_prev, rsi_mom, volume_ratio, atr).
+
+    Undefined values map to 0.0 exactly as in ``MomentumStrategy.generate_signal``;
+    only the trailing windows of each column are read.
+    """
+    n = close.shape[0]
+    last = n - 1
+
+    price_mom_prev = close[last - 1] / close[last - 1 - momentum_period] - 1.0
+    price_mom = close[last] / close[last - momentum_period] - 1.0
+    if np.isnan(price_mom_prev):
+        price_mom_prev = 0.0
+    if np.isnan(price_mom):
+        price_mom = 0.0
+
+    rsi_mom_prev, rsi_mom = _rsi_momentum_pair(close, last, momentum_period, rsi_period)
+
+    volume_ratio = 0.0
+    if n >= momentum_period:
+        volume_sum = 0.0
+        for k in range(n - momentum_period, n):
+            volume_sum += volume[k]
+        volume_ma = volume_sum / momentum_period
+        if volume_ma > 0:
+            volume_ratio = volume[last] / volume_ma
+
+    atr = 0.0
+    if n >= atr_period:
+        tr_sum = 0.0
+        for k in range(n - atr_period, n):
+            prev_close = close[k - 1] if k > 0 else np.nan
+            tr = _nan_max(
+                _nan_max(abs(high[k] - low[k]), abs(high[k] - prev_close)),
+                abs(low[k] - prev_close),
+            )
+            tr_sum += tr
+        atr = tr_sum / atr_period
+        if not np.isfinite(atr):
+            atr = 0.0
+
+    return price_mom_prev, price_mom, rsi_mom_prev, rsi_mom, volume_ratio, atr
+
+
+def warmup() -> None:
+    """Compile (or load from cache) the kernel before the first signal."""
+    if not NUMBA_AVAILABLE:
+        return
+    bars = np.linspace(1.0, 2.0, 8)
+    momentum_stats(bars, bars, bars, bars, 2, 2, 2)
+
+
+if settings.jit_warmup:
+    warmup()
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 import pandas as pd
 
 from alpha_arena.data import DataService
+from alpha_arena.strategies._candle_cache import CandleColumns, load_ohlcv
 from alpha_arena.strategies.signals import StrategySignal
 
+T = TypeVar("T")
+
 
 class BaseStrategy(ABC):
     """Strategy interface; strategies read data via DataService only."""
@@ -29,12 +32,45 @@ class BaseStrategy(ABC):
         self.data_service = data_service
         self.params = params or {}
         self.data_limit = data_limit
+        # (timestamp, close) of the latest candle seen by get_candles.
+        self._last_bar: Optional[Tuple[int, float]] = None
+        # (candle frame, indicator values); the frame is held so its identity stays valid.
+        self._ind_cache: Optional[Tuple[pd.DataFrame, Any]] = None
 
     def get_candles(self) -> pd.DataFrame:
-        return self.data_service.get_ohlcv(
-            self.symbol, self.timeframe, limit=self.data_limit
-        )
+        """Latest candles; the frame is shared across strategies, do not mutate it."""
+        return self.get_candles_np().frame
+
+    def get_candles_np(self) -> CandleColumns:
+        """Latest candles as read-only NumPy columns (``.frame`` holds the DataFrame)."""
+        self._last_bar = None
+        bars = load_ohlcv(self.data_service, self.symbol, self.timeframe, self.data_limit)
+        if not bars.frame.empty:
+            self._last_bar = (int(bars["timestamp"][-1]), float(bars["close"][-1]))
+        return bars
+
+    def with_indicators(
+        self, df: pd.DataFrame, compute: Callable[[pd.DataFrame], T]
+    ) -> T:
+        """Return ``compute(df)``, reused while ``load_ohlcv`` hands back the same frame.
+
+        Keyed on the frame itself, so any change the candle cache picks up (a new
+        bar or one backfilled into the window) recomputes. Do not mutate the result.
+        """
+        cached = self._ind_cache
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        values = compute(df)
+        self._ind_cache = (df, values)
+        return values
 
     @abstractmethod
     def generate_signal(self) -> StrategySignal:
         raise NotImplementedError
+
+    @classmethod
+    def generate_signals_batch(
+        cls, strategies: Sequence["BaseStrategy"]
+    ) -> List[StrategySignal]:
+        """One signal per instance; subclasses may vectorize across symbols."""
+        return [strategy.generate_signal() for strategy in strategies]
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from math import isfinite
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from alpha_arena.strategies.base import BaseStrategy
-from alpha_arena.strategies.indicators import bollinger_bands, rsi
+from alpha_arena.strategies.indicators import bollinger_bands, rsi, tail
 from alpha_arena.strategies.signals import SignalType, StrategySignal
 
+_RSI_PERIOD = 14
+
 
 class BollingerRangeStrategy(BaseStrategy):
     """Bollinger band ranging strategy."""
@@ -49,71 +53,137 @@ class BollingerRangeStrategy(BaseStrategy):
         if df.empty or len(df) < self.params["bb_period"] + 5:
             return self._hold("not_enough_data")
 
-        df = df.copy()
-        bands = bollinger_bands(
-            df["close"], self.params["bb_period"], self.params["bb_std"]
+        upper, mid, lower, bandwidth, rsi_val = self.with_indicators(
+            df, self._compute_indicators
         )
-        df = df.join(bands)
-        df["rsi"] = rsi(df["close"], 14)
-
-        last = df.iloc[-1]
-        price = float(last["close"])
-        ts = int(last["timestamp"])
-        bandwidth = float(last["bandwidth"]) if pd.notna(last["bandwidth"]) else 1.0
-        rsi_val = float(last["rsi"])
+        price = float(df["close"].iat[-1])
+        ts = int(df["timestamp"].iat[-1])
+        bandwidth = float(bandwidth) if isfinite(bandwidth) else 1.0
+        rsi_val = float(rsi_val)
 
         if bandwidth > self.params["bandwidth_max"]:
             return self._hold("bandwidth_too_wide")
 
-        lower = float(last["lower"])
-        upper = float(last["upper"])
-        mid = float(last["mid"])
+        lower = float(lower)
+        upper = float(upper)
+        mid = float(mid)
 
         if price <= lower * self.params["touch_threshold"] and rsi_val < self.params[
             "rsi_oversold"
         ]:
-            return StrategySignal(
-                strategy=self.name,
-                symbol=self.symbol,
-                timeframe=self.timeframe,
-                signal_type=SignalType.BUY,
-                confidence=0.75,
-                timestamp=ts,
-                price=price,
-                stop_loss=price * (1 - self.params["stop_loss_pct"]),
-                take_profit=mid,
-                position_size=self.params["max_position"],
-                leverage=self.params["max_leverage"],
-                reasoning="Price touched lower band in low-volatility range.",
-            )
+            return self._band_signal(SignalType.BUY, ts, price, mid)
 
         if price >= upper / self.params["touch_threshold"] and rsi_val > self.params[
             "rsi_overbought"
         ]:
-            return StrategySignal(
-                strategy=self.name,
-                symbol=self.symbol,
-                timeframe=self.timeframe,
-                signal_type=SignalType.SELL,
-                confidence=0.75,
-                timestamp=ts,
-                price=price,
-                stop_loss=price * (1 + self.params["stop_loss_pct"]),
-                take_profit=mid,
-                position_size=self.params["max_position"],
-                leverage=self.params["max_leverage"],
-                reasoning="Price touched upper band in low-volatility range.",
-            )
+            return self._band_signal(SignalType.SELL, ts, price, mid)
 
         return self._hold("no_signal")
 
+    @classmethod
+    def generate_signals_batch(
+        cls, strategies: Sequence[BaseStrategy]
+    ) -> List[StrategySignal]:
+        """Evaluate same-params instances across symbols with one 2-D NumPy pass."""
+        strategies = list(strategies)
+        params = strategies[0].params if strategies else {}
+        if len(strategies) < 2 or any(s.params != params for s in strategies):
+            return super().generate_signals_batch(strategies)
+
+        period = int(params["bb_period"])
+        window = max(period, _RSI_PERIOD) + 1
+        frames = [s.get_candles() for s in strategies]
+        ready = [i for i, df in enumerate(frames) if len(df) >= max(period + 5, window)]
+        signals: List[Optional[StrategySignal]] = [None] * len(strategies)
+        for i in set(range(len(strategies))) - set(ready):
+            signals[i] = strategies[i]._hold("not_enough_data")
+        if not ready:
+            return signals
+
+        close = np.stack(
+            [frames[i]["close"].to_numpy(dtype=np.float64)[-window:] for i in ready]
+        )
+        price = close[:, -1]
+        # Same definitions as indicators.bollinger_bands / rsi, last bar only.
+        band_window = close[:, -period:]
+        mid = band_window.mean(axis=1)
+        std = band_window.std(axis=1, ddof=1) * params["bb_std"]
+        upper = mid + std
+        lower = mid - std
+        safe_mid = np.where(mid != 0, mid, 1.0)
+        bandwidth = np.where(mid != 0, (upper - lower) / safe_mid, 1.0)
+        # generate_signal reads a non-finite bandwidth as 1.0.
+        bandwidth = np.where(np.isfinite(bandwidth), bandwidth, 1.0)
+        delta = np.diff(close[:, -(_RSI_PERIOD + 1) :], axis=1)
+        avg_gain = np.clip(delta, 0.0, None).mean(axis=1)
+        avg_loss = np.clip(-delta, 0.0, None).mean(axis=1)
+        safe_loss = np.where(avg_loss > 0, avg_loss, 1.0)
+        rsi_val = np.where(avg_loss > 0, 100 - 100 / (1 + avg_gain / safe_loss), 0.0)
+
+        touch = params["touch_threshold"]
+        narrow = bandwidth <= params["bandwidth_max"]
+        buy = narrow & (price <= lower * touch) & (rsi_val < params["rsi_oversold"])
+        sell = (
+            narrow
+            & ~buy
+            & (price >= upper / touch)
+            & (rsi_val > params["rsi_overbought"])
+        )
+
+        for row, i in enumerate(ready):
+            strategy = strategies[i]
+            ts = int(frames[i]["timestamp"].iat[-1])
+            if buy[row]:
+                signals[i] = strategy._band_signal(
+                    SignalType.BUY, ts, float(price[row]), float(mid[row])
+                )
+            elif sell[row]:
+                signals[i] = strategy._band_signal(
+                    SignalType.SELL, ts, float(price[row]), float(mid[row])
+                )
+            else:
+                signals[i] = strategy._hold(
+                    "no_signal" if narrow[row] else "bandwidth_too_wide"
+                )
+        return signals
+
+    def _band_signal(
+        self, side: SignalType, ts: int, price: float, mid: float
+    ) -> StrategySignal:
+        is_buy = side == SignalType.BUY
+        stop_loss_pct = self.params["stop_loss_pct"]
+        return StrategySignal(
+            strategy=self.name,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            signal_type=side,
+            confidence=0.75,
+            timestamp=ts,
+            price=price,
+            stop_loss=price * (1 - stop_loss_pct if is_buy else 1 + stop_loss_pct),
+            take_profit=mid,
+            position_size=self.params["max_position"],
+            leverage=self.params["max_leverage"],
+            reasoning=(
+                "Price touched lower band in low-volatility range."
+                if is_buy
+                else "Price touched upper band in low-volatility range."
+            ),
+        )
+
+    def _compute_indicators(self, df: pd.DataFrame) -> Tuple[Any, ...]:
+        """Last-bar (upper, mid, lower, bandwidth, rsi) without touching ``df``."""
+        # Both indicators are rolling windows, so only the tail feeds the last bar.
+        period = int(self.params["bb_period"])
+        close = df["close"]
+        bands = bollinger_bands(tail(close, period), period, self.params["bb_std"])
+        upper, mid, lower, bandwidth = bands.to_numpy()[-1]
+        rsi_last = rsi(tail(close, _RSI_PERIOD), _RSI_PERIOD).iat[-1]
+        return upper, mid, lower, bandwidth, rsi_last
+
     def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        df = self.get_candles()
-        if not df.empty:
-            ts = int(df.iloc[-1]["timestamp"])
-            price = float(df.iloc[-1]["close"])
+        # Reuse the bar from this cycle's fetch instead of reloading candles.
+        ts, price = self._last_bar or (0, 0.0)
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
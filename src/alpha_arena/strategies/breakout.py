@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from math import isfinite
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
 from alpha_arena.strategies.base import BaseStrategy
-from alpha_arena.strategies.indicators import atr, volume_ma
+from alpha_arena.strategies.indicators import atr, tail, volume_ma
 from alpha_arena.strategies.signals import SignalType, StrategySignal
 
 logger = logging.getLogger(__name__)
@@ -66,25 +67,17 @@ class BreakoutStrategy(BaseStrategy):
             if len(df) < min_len:
                 return self._hold("not_enough_data")
 
-            df = df.copy()
-            # Indicators stay inside the strategy (reuse shared indicator helpers).
-            df["atr"] = atr(df, atr_period)
-            df["volume_ma"] = volume_ma(df["volume"], volume_period)
-
-            # Use the previous N candles to avoid lookahead bias in key levels.
-            history = df.iloc[-(lookback + 1) : -1]
-            if history.empty:
-                return self._hold("not_enough_history")
+            atr_last, volume_ma_last, resistance, support = self.with_indicators(
+                df, self._compute_indicators
+            )
 
-            last = df.iloc[-1]
-            price = float(last["close"])
-            ts = int(last["timestamp"])
+            price = float(df["close"].iat[-1])
+            ts = int(df["timestamp"].iat[-1])
+            volume = float(df["volume"].iat[-1])
             if price <= 0:
                 return self._hold("invalid_price")
 
-            resistance = float(history["high"].max())
-            support = float(history["low"].min())
-            if not pd.notna(resistance) or not pd.notna(support):
+            if not (isfinite(resistance) and isfinite(support)):
                 return self._hold("invalid_levels")
 
             # Add a small buffer to reduce false breakouts.
@@ -93,16 +86,12 @@ class BreakoutStrategy(BaseStrategy):
             short_breakout = price <= support / breakout_threshold
 
             # Confirm breakouts with volume expansion versus its rolling mean.
-            volume_ma_val = (
-                float(last["volume_ma"]) if pd.notna(last["volume_ma"]) else 0.0
-            )
-            volume_ratio = (
-                float(last["volume"] / volume_ma_val) if volume_ma_val > 0 else 0.0
-            )
+            volume_ma_val = float(volume_ma_last) if isfinite(volume_ma_last) else 0.0
+            volume_ratio = volume / volume_ma_val if volume_ma_val > 0 else 0.0
             volume_ok = volume_ratio >= float(self.params["volume_threshold"])
 
             # ATR-based risk controls scale with recent volatility.
-            atr_val = float(last["atr"]) if pd.notna(last["atr"]) else 0.0
+            atr_val = float(atr_last) if isfinite(atr_last) else 0.0
             if long_breakout and volume_ok:
                 stop_loss = (
                     price - atr_val * self.params["stop_loss_atr"] if atr_val else None
@@ -161,16 +150,23 @@ class BreakoutStrategy(BaseStrategy):
             logger.exception("BreakoutStrategy failed during signal generation: %s", exc)
             return self._hold("error")
 
+    def _compute_indicators(self, df: pd.DataFrame) -> Tuple[float, float, float, float]:
+        """Last-bar (atr, volume_ma, resistance, support) without touching ``df``."""
+        lookback = int(self.params["lookback_period"])
+        atr_period = int(self.params["atr_period"])
+        # All rolling windows, so only the tail feeds the last bar.
+        # Use the previous N candles to avoid lookahead bias in key levels.
+        levels = tail(df[["high", "low"]], lookback).shift(1)
+        return (
+            float(atr(tail(df, atr_period), atr_period).iat[-1]),
+            float(volume_ma(tail(df["volume"], lookback), lookback).iat[-1]),
+            float(levels["high"].rolling(lookback, min_periods=lookback).max().iat[-1]),
+            float(levels["low"].rolling(lookback, min_periods=lookback).min().iat[-1]),
+        )
+
     def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        try:
-            df = self.get_candles()
-        except Exception:
-            df = pd.DataFrame()
-        if not df.empty:
-            ts = int(df.iloc[-1]["timestamp"])
-            price = float(df.iloc[-1]["close"])
+        # Reuse the bar from this cycle's fetch instead of reloading candles.
+        ts, price = self._last_bar or (0, 0.0)
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from math import isfinite
+from typing import Dict, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
 from alpha_arena.strategies.base import BaseStrategy
-from alpha_arena.strategies.indicators import atr, ema, macd, rsi, volume_ma
+from alpha_arena.strategies.indicators import (
+    atr_last,
+    ema_array,
+    rsi_last,
+    volume_ma_last,
+)
 from alpha_arena.strategies.signals import SignalType, StrategySignal
 
+RSI_PERIOD = 14
+VOLUME_MA_PERIOD = 20
+
+
+def _macd_last(close: np.ndarray) -> Tuple[float, float]:
+    """Last MACD and signal values; the signal EMA needs the whole MACD line."""
+    macd_line = ema_array(close, 12) - ema_array(close, 26)
+    return float(macd_line[-1]), float(ema_array(macd_line, 9)[-1])
+
 
 class EMATrendStrategy(BaseStrategy):
     """EMA trend strategy based on the BTC strategy library."""
@@ -47,48 +62,63 @@ class EMATrendStrategy(BaseStrategy):
             params=default_params,
             data_limit=data_limit,
         )
+        self._ema_spans = (
+            int(default_params["ema_fast"]),
+            int(default_params["ema_medium"]),
+            int(default_params["ema_slow"]),
+        )
+        self._atr_period = int(default_params["atr_period"])
+        self._stop_loss_atr = float(default_params["stop_loss_atr"])
+        self._take_profit_atr = float(default_params["take_profit_atr"])
+        self._max_position = default_params["max_position"]
+        self._max_leverage = default_params["max_leverage"]
+        self._rsi_min = float(default_params["rsi_min"])
+        self._rsi_max = float(default_params["rsi_max"])
+        self._rsi_short_min = float(default_params["rsi_short_min"])
+        self._rsi_short_max = float(default_params["rsi_short_max"])
+        self._volume_threshold = float(default_params["volume_threshold"])
 
     def generate_signal(self) -> StrategySignal:
-        df = self.get_candles()
-        if df.empty or len(df) < self.params["ema_slow"] + 5:
+        bars = self.get_candles_np()
+        if len(bars.frame) < self._ema_spans[2] + 5:
             return self._hold("not_enough_data")
 
-        df = df.copy()
-        df["ema_fast"] = ema(df["close"], self.params["ema_fast"])
-        df["ema_medium"] = ema(df["close"], self.params["ema_medium"])
-        df["ema_slow"] = ema(df["close"], self.params["ema_slow"])
-        df["atr"] = atr(df, self.params["atr_period"])
-        df["rsi"] = rsi(df["close"], 14)
-        df["volume_ma"] = volume_ma(df["volume"], 20)
-        macd_df = macd(df["close"])
-        df["macd"] = macd_df["macd"]
-        df["macd_signal"] = macd_df["signal"]
-
-        last = df.iloc[-1]
-        price = float(last["close"])
-        ts = int(last["timestamp"])
-
-        is_uptrend = (
-            last["ema_fast"] > last["ema_medium"] > last["ema_slow"]
-            and price > last["ema_fast"]
+        close = bars["close"]
+        price = float(close[-1])
+        ts = int(bars["timestamp"][-1])
+
+        # Cheapest gates first; HOLD is the common outcome.
+        ema_fast, ema_medium, ema_slow = (
+            float(ema_array(close, span)[-1]) for span in self._ema_spans
         )
-        is_downtrend = (
-            last["ema_fast"] < last["ema_medium"] < last["ema_slow"]
-            and price < last["ema_fast"]
+        is_uptrend = ema_fast > ema_medium > ema_slow and price > ema_fast
+        is_downtrend = ema_fast < ema_medium < ema_slow and price < ema_fast
+        if not (is_uptrend or is_downtrend):
+            return self._hold("no_signal")
+
+        volumes = bars["volume"]
+        volume_ma = volume_ma_last(volumes, VOLUME_MA_PERIOD)
+        if not float(volumes[-1]) > volume_ma * self._volume_threshold:
+            return self._hold("no_signal")
+
+        rsi_low, rsi_high = (
+            (self._rsi_min, self._rsi_max)
+            if is_uptrend
+            else (self._rsi_short_min, self._rsi_short_max)
         )
+        if not rsi_low < rsi_last(close, RSI_PERIOD) < rsi_high:
+            return self._hold("no_signal")
 
-        volume_ok = last["volume"] > last["volume_ma"] * self.params["volume_threshold"]
-        macd_bullish = last["macd"] > last["macd_signal"] and last["macd"] > 0
-        macd_bearish = last["macd"] < last["macd_signal"] and last["macd"] < 0
-        rsi_val = float(last["rsi"])
+        macd, macd_signal = _macd_last(close)
+        if is_uptrend and not (macd > macd_signal and macd > 0):
+            return self._hold("no_signal")
+        if is_downtrend and not (macd < macd_signal and macd < 0):
+            return self._hold("no_signal")
 
-        atr_val = float(last["atr"]) if pd.notna(last["atr"]) else 0.0
-        stop_loss = price - atr_val * self.params["stop_loss_atr"]
-        take_profit = price + atr_val * self.params["take_profit_atr"]
+        atr_val = atr_last(bars, self._atr_period)
+        atr_val = atr_val if isfinite(atr_val) else 0.0
 
-        if is_uptrend and macd_bullish and volume_ok and (
-            self.params["rsi_min"] < rsi_val < self.params["rsi_max"]
-        ):
+        if is_uptrend:
             return StrategySignal(
                 strategy=self.name,
                 symbol=self.symbol,
@@ -97,44 +127,31 @@ class EMATrendStrategy(BaseStrategy):
                 confidence=0.85,
                 timestamp=ts,
                 price=price,
-                stop_loss=stop_loss if atr_val else None,
-                take_profit=take_profit if atr_val else None,
-                position_size=self.params["max_position"],
-                leverage=self.params["max_leverage"],
+                stop_loss=price - atr_val * self._stop_loss_atr if atr_val else None,
+                take_profit=price + atr_val * self._take_profit_atr if atr_val else None,
+                position_size=self._max_position,
+                leverage=self._max_leverage,
                 reasoning="EMA trend up with MACD confirmation and volume surge.",
             )
 
-        if is_downtrend and macd_bearish and volume_ok and (
-            self.params["rsi_short_min"] < rsi_val < self.params["rsi_short_max"]
-        ):
-            return StrategySignal(
-                strategy=self.name,
-                symbol=self.symbol,
-                timeframe=self.timeframe,
-                signal_type=SignalType.SELL,
-                confidence=0.85,
-                timestamp=ts,
-                price=price,
-                stop_loss=price + atr_val * self.params["stop_loss_atr"]
-                if atr_val
-                else None,
-                take_profit=price - atr_val * self.params["take_profit_atr"]
-                if atr_val
-                else None,
-                position_size=self.params["max_position"],
-                leverage=self.params["max_leverage"],
-                reasoning="EMA trend down with MACD confirmation and volume surge.",
-            )
-
-        return self._hold("no_signal")
+        return StrategySignal(
+            strategy=self.name,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            signal_type=SignalType.SELL,
+            confidence=0.85,
+            timestamp=ts,
+            price=price,
+            stop_loss=price + atr_val * self._stop_loss_atr if atr_val else None,
+            take_profit=price - atr_val * self._take_profit_atr if atr_val else None,
+            position_size=self._max_position,
+            leverage=self._max_leverage,
+            reasoning="EMA trend down with MACD confirmation and volume surge.",
+        )
 
     def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        df = self.get_candles()
-        if not df.empty:
-            ts = int(df.iloc[-1]["timestamp"])
-            price = float(df.iloc[-1]["close"])
+        # Reuse the bar from this cycle's fetch instead of reloading candles.
+        ts, price = self._last_bar or (0, 0.0)
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
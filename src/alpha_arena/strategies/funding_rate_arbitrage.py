@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Optional
 
 from alpha_arena.strategies.base import BaseStrategy
 from alpha_arena.strategies.signals import SignalType, StrategySignal
@@ -37,27 +39,27 @@ class FundingRateArbitrageStrategy(BaseStrategy):
             params=default_params,
             data_limit=data_limit,
         )
-        self._funding_history: List[float] = []
+        self._funding_history: Deque[float] = deque(
+            maxlen=int(default_params["history_window"])
+        )
 
     def generate_signal(self) -> StrategySignal:
         funding = self.data_service.get_latest_funding(self.symbol)
+        bars = self.get_candles_np()
+        price = 0.0 if bars.frame.empty else float(bars["close"][-1])
         if funding is None:
-            return self._hold("no_funding_data")
+            return self._hold("no_funding_data", price=price)
 
         rate = float(funding.funding_rate)
         self._funding_history.append(rate)
-        if len(self._funding_history) > self.params["history_window"]:
-            self._funding_history.pop(0)
 
-        price = 0.0
         ts = int(funding.timestamp)
-        candles = self.get_candles()
-        if not candles.empty:
-            price = float(candles.iloc[-1]["close"])
 
         if rate >= self.params["min_funding_rate"]:
             if len(self._funding_history) >= self.params["min_duration"]:
-                recent = self._funding_history[-self.params["min_duration"] :]
+                recent = islice(
+                    reversed(self._funding_history), self.params["min_duration"]
+                )
                 if all(r >= self.params["min_funding_rate"] for r in recent):
                     return StrategySignal(
                         strategy=self.name,
@@ -90,17 +92,10 @@ class FundingRateArbitrageStrategy(BaseStrategy):
                 reasoning="Funding rate normalized; exit arbitrage.",
             )
 
-        return self._hold("no_signal")
+        return self._hold("no_signal", ts, price)
 
-    def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        funding = self.data_service.get_latest_funding(self.symbol)
-        if funding:
-            ts = int(funding.timestamp)
-        candles = self.get_candles()
-        if not candles.empty:
-            price = float(candles.iloc[-1]["close"])
+    def _hold(self, reason: str, ts: int = 0, price: float = 0.0) -> StrategySignal:
+        # Callers pass the funding/candle values already fetched this cycle.
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+from math import isfinite
 from typing import Dict, Optional
 
-import pandas as pd
+import numpy as np
 
 from alpha_arena.strategies.base import BaseStrategy
 from alpha_arena.strategies.indicators import bollinger_bands
@@ -44,48 +45,57 @@ class GridTradingStrategy(BaseStrategy):
             params=default_params,
             data_limit=data_limit,
         )
-        # Track which grid levels currently have an open position.
-        self._grid_positions: dict[int, bool] = {}
+        self._grid_count = int(default_params["grid_count"])
+        self._grid_range = float(default_params["grid_range"])
+        self._bb_period = int(default_params["bb_period"])
+        self._bb_std = float(default_params["bb_std"])
+        self._position_per_grid = float(default_params["position_per_grid"])
+        self._max_position = float(default_params["max_position"])
+        self._max_leverage = default_params["max_leverage"]
+        # Open-position flag per grid level; the level count is fixed per instance.
+        self._grid_positions = np.zeros(max(self._grid_count, 0), dtype=bool)
 
     def generate_signal(self) -> StrategySignal:
         """Generate grid trading signals based on price crossing grid lines."""
         try:
-            df = self.get_candles()
+            bars = self.get_candles_np()
         except Exception as exc:
             logger.exception("GridTradingStrategy failed to load candles: %s", exc)
             return self._hold("data_error")
+        df = bars.frame
 
         required_cols = {"timestamp", "close"}
         if df.empty or not required_cols.issubset(df.columns):
             return self._hold("not_enough_data")
 
-        bb_period = int(self.params["bb_period"])
+        bb_period = self._bb_period
         min_len = bb_period + 2
         if len(df) < min_len:
             return self._hold("not_enough_data")
 
         try:
-            df = df.copy()
-            bands = bollinger_bands(df["close"], bb_period, float(self.params["bb_std"]))
-            df = df.join(bands)
-
-            last = df.iloc[-1]
-            price = float(last["close"])
-            ts = int(last["timestamp"])
-            prev_price = float(df.iloc[-2]["close"])
-
-            mid = float(last["mid"]) if pd.notna(last["mid"]) else 0.0
-            bandwidth = float(last["bandwidth"]) if pd.notna(last["bandwidth"]) else 0.0
+            close_arr = bars["close"]
+            bands = bollinger_bands(df["close"], bb_period, self._bb_std)
+            mid_last = bands["mid"].to_numpy()[-1]
+            bandwidth_last = bands["bandwidth"].to_numpy()[-1]
+
+            price = float(close_arr[-1])
+            ts = int(bars["timestamp"][-1])
+            prev_price = float(close_arr[-2])
+
+            mid, bandwidth = float(mid_last), float(bandwidth_last)
+            mid = mid if isfinite(mid) else 0.0
+            bandwidth = bandwidth if isfinite(bandwidth) else 0.0
             if mid <= 0:
                 return self._hold("invalid_mid")
 
             # Grid range uses Bollinger bandwidth when available, with param fallback.
-            base_range = float(self.params["grid_range"])
+            base_range = self._grid_range
             grid_range = max(base_range, bandwidth * 2.0) if bandwidth > 0 else base_range
             if grid_range <= 0:
                 return self._hold("invalid_grid_range")
 
-            grid_count = int(self.params["grid_count"])
+            grid_count = self._grid_count
             if grid_count < 2:
                 return self._hold("invalid_grid_count")
 
@@ -96,25 +106,21 @@ class GridTradingStrategy(BaseStrategy):
                 return self._hold("invalid_bounds")
 
             step = (upper - lower) / (grid_count - 1)
-            grid_levels = [lower + step * idx for idx in range(grid_count)]
-
-            self._ensure_grid_positions(grid_count)
-
-            buy_candidates: list[tuple[int, float]] = []
-            sell_candidates: list[tuple[int, float]] = []
-            for idx, level in enumerate(grid_levels):
-                if prev_price > level and price <= level and not self._grid_positions.get(
-                    idx, False
-                ):
-                    buy_candidates.append((idx, level))
-                if prev_price < level and price >= level and self._grid_positions.get(
-                    idx, False
-                ):
-                    sell_candidates.append((idx, level))
-
-            if buy_candidates:
+            grid_levels = lower + step * np.arange(grid_count)
+
+            opened = self._grid_positions
+            # Levels are ascending, so the first/last hit is the lowest/highest level.
+            buy_hits = np.flatnonzero(
+                (prev_price > grid_levels) & (price <= grid_levels) & ~opened
+            )
+            sell_hits = np.flatnonzero(
+                (prev_price < grid_levels) & (price >= grid_levels) & opened
+            )
+
+            if buy_hits.size:
                 # Pick the closest crossed level to current price for a single signal.
-                idx, level = min(buy_candidates, key=lambda item: item[1])
+                idx = int(buy_hits[0])
+                level = float(grid_levels[idx])
                 position_size = self._position_size_for_new_grid()
                 if position_size <= 0:
                     return self._hold("max_position_reached")
@@ -130,13 +136,14 @@ class GridTradingStrategy(BaseStrategy):
                     stop_loss=None,
                     take_profit=None,
                     position_size=position_size,
-                    leverage=self.params["max_leverage"],
+                    leverage=self._max_leverage,
                     reasoning=f"Price crossed below grid level {level:.2f}.",
                 )
 
-            if sell_candidates:
+            if sell_hits.size:
                 # Pick the closest crossed level to current price for a single signal.
-                idx, level = max(sell_candidates, key=lambda item: item[1])
+                idx = int(sell_hits[-1])
+                level = float(grid_levels[idx])
                 self._grid_positions[idx] = False
                 return StrategySignal(
                     strategy=self.name,
@@ -148,8 +155,8 @@ class GridTradingStrategy(BaseStrategy):
                     price=price,
                     stop_loss=None,
                     take_profit=None,
-                    position_size=float(self.params["position_per_grid"]),
-                    leverage=self.params["max_leverage"],
+                    position_size=self._position_per_grid,
+                    leverage=self._max_leverage,
                     reasoning=f"Price crossed above grid level {level:.2f}.",
                 )
 
@@ -158,36 +165,18 @@ class GridTradingStrategy(BaseStrategy):
             logger.exception("GridTradingStrategy failed during signal generation: %s", exc)
             return self._hold("error")
 
-    def _ensure_grid_positions(self, grid_count: int) -> None:
-        if not self._grid_positions or len(self._grid_positions) != grid_count:
-            self._grid_positions = {idx: False for idx in range(grid_count)}
-            return
-        for idx in range(grid_count):
-            self._grid_positions.setdefault(idx, False)
-        for idx in list(self._grid_positions.keys()):
-            if idx >= grid_count:
-                del self._grid_positions[idx]
-
     def _position_size_for_new_grid(self) -> float:
-        position_per_grid = float(self.params["position_per_grid"])
-        max_position = float(self.params["max_position"])
-        open_count = sum(1 for opened in self._grid_positions.values() if opened)
+        position_per_grid = self._position_per_grid
+        open_count = int(np.count_nonzero(self._grid_positions))
         current_exposure = open_count * position_per_grid
-        remaining = max_position - current_exposure
+        remaining = self._max_position - current_exposure
         if remaining <= 0:
             return 0.0
         return min(position_per_grid, remaining)
 
     def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        try:
-            df = self.get_candles()
-        except Exception:
-            df = pd.DataFrame()
-        if not df.empty:
-            ts = int(df.iloc[-1]["timestamp"])
-            price = float(df.iloc[-1]["close"])
+        # Reuse the bar from this cycle's fetch instead of reloading candles.
+        ts, price = self._last_bar or (0, 0.0)
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
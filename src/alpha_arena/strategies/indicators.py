@@ -2,12 +2,115 @@
 
 from __future__ import annotations
 
+from typing import Union
+
 import numpy as np
 import pandas as pd
 
+from alpha_arena.config import settings
+from alpha_arena.utils._njit import NUMBA_AVAILABLE, njit
+
+
+PandasObj = Union[pd.Series, pd.DataFrame]
+
+
+def tail(data: PandasObj, period: int, warmup: int = 1) -> PandasObj:
+    """Rows needed for the last value of a rolling-window (not EMA) indicator."""
+    return data.iloc[-(period + warmup) :]
+
+
+def _safe_divide(num: PandasObj, denom: PandasObj) -> np.ndarray:
+    """``num / denom`` as float64 with NaN wherever ``denom`` is zero."""
+    num_arr = np.asarray(num, dtype=np.float64)
+    denom_arr = np.asarray(denom, dtype=np.float64)
+    return np.divide(
+        num_arr, denom_arr, out=np.full_like(num_arr, np.nan), where=denom_arr != 0
+    )
+
+
+@njit(cache=True)
+def _ema_loop(x: np.ndarray, alpha: float) -> np.ndarray:
+    """``ewm(adjust=False).mean()`` recurrence, including pandas' NaN handling."""
+    out = np.empty_like(x)
+    if x.shape[0] == 0:
+        return out
+    decay = 1.0 - alpha
+    weighted = x[0]
+    out[0] = weighted
+    old_wt = 1.0
+    for i in range(1, x.shape[0]):
+        cur = x[i]
+        if not np.isnan(weighted):
+            old_wt *= decay
+            if not np.isnan(cur):
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif not np.isnan(cur):
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def _rolling_mean_loop(x: np.ndarray, window: int) -> np.ndarray:
+    """``rolling(window).mean()`` as one running sum, restarted after each NaN."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    run = 0  # consecutive non-NaN values ending at i
+    nonzero = 0  # nonzero values in the current window
+    for i in range(n):
+        val = x[i]
+        if np.isnan(val):
+            total = 0.0
+            run = nonzero = 0
+            continue
+        total += val
+        if val != 0:
+            nonzero += 1
+        run += 1
+        if run > window:
+            old = x[i - window]
+            total -= old
+            if old != 0:
+                nonzero -= 1
+            run = window
+        if run == window:
+            # An all-zero window is exactly 0, not the sum's rounding residue.
+            out[i] = total / window if nonzero else 0.0
+    return out
+
+
+@njit(cache=True)
+def _rsi_loop(x: np.ndarray, period: int) -> np.ndarray:
+    """Mean-gain/mean-loss RSI of :func:`rsi`, NaN and zero-loss mapped to 0."""
+    n = x.shape[0]
+    gain = np.empty(n)
+    loss = np.empty(n)
+    if n:
+        gain[0] = loss[0] = np.nan
+    for i in range(1, n):
+        delta = x[i] - x[i - 1]
+        gain[i] = max(delta, 0.0)
+        loss[i] = -min(delta, 0.0)
+    avg_gain = _rolling_mean_loop(gain, period)
+    avg_loss = _rolling_mean_loop(loss, period)
+    out = np.zeros(n)
+    for i in range(n):
+        if avg_loss[i] != 0 and not np.isnan(avg_loss[i]) and not np.isnan(avg_gain[i]):
+            out[i] = 100 - (100 / (1 + avg_gain[i] / avg_loss[i]))
+    return out
+
+
+def ema_array(values: np.ndarray, span: int) -> np.ndarray:
+    """NumPy counterpart of :func:`ema` for float64 arrays."""
+    return _ema_loop(values, 2.0 / (span + 1.0))
+
 
 def ema(series: pd.Series, span: int) -> pd.Series:
-    return series.ewm(span=span, adjust=False).mean()
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(ema_array(values, span), index=series.index, name=series.name)
 
 
 def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
@@ -22,38 +125,82 @@ def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) ->
     )
 
 
+def rsi_array(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """NumPy counterpart of :func:`rsi` for float64 arrays."""
+    return _rsi_loop(values, int(period))
+
+
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    delta = series.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
-    rs = avg_gain / avg_loss.replace(0, pd.NA)
-    rsi_val = 100 - (100 / (1 + rs))
-    return rsi_val.fillna(0)
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(rsi_array(values, period), index=series.index, name=series.name)
+
+
+def _true_range(df: pd.DataFrame) -> pd.Series:
+    """Row-wise NaN-skipping max of |H-L|, |H-Cp|, |L-Cp| in one NumPy pass."""
+    high = df["high"].to_numpy(dtype=np.float64, na_value=np.nan)
+    low = df["low"].to_numpy(dtype=np.float64, na_value=np.nan)
+    close = df["close"].to_numpy(dtype=np.float64, na_value=np.nan)
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    # fmax ignores NaN like DataFrame.max(axis=1), so the first bar keeps |H-L|.
+    tr = np.fmax(
+        np.fmax(np.abs(high - low), np.abs(high - prev_close)),
+        np.abs(low - prev_close),
+    )
+    return pd.Series(tr, index=df.index)
 
 
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-    prev_close = close.shift(1)
-    tr = pd.concat(
-        [
-            (high - low).abs(),
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-    return tr.rolling(window=period).mean()
+    return _true_range(df).rolling(window=period).mean()
+
+
+# Last-bar variants for the live signal path: each reads only the trailing
+# window of a DataFrame or CandleColumns and returns the final value of its
+# full-series counterpart.
+
+
+def _last(data, column: str, count: int) -> np.ndarray:
+    return np.asarray(data[column], dtype=np.float64)[-count:]
+
+
+def atr_last(data, period: int = 14) -> float:
+    """Last value of :func:`atr`; NaN with fewer than ``period`` bars."""
+    high = _last(data, "high", period)
+    if high.shape[0] < period:
+        return float("nan")
+    low = _last(data, "low", period)
+    close = _last(data, "close", period + 1)
+    prev_close = close[:-1] if close.shape[0] > period else np.r_[np.nan, close[:-1]]
+    tr = np.fmax(
+        np.fmax(np.abs(high - low), np.abs(high - prev_close)),
+        np.abs(low - prev_close),
+    )
+    return float(tr.mean())
+
+
+def rsi_last(series, period: int = 14) -> float:
+    """Last value of :func:`rsi`; 0.0 when undefined, as in the full series."""
+    delta = np.diff(np.asarray(series, dtype=np.float64)[-(period + 1) :])
+    if delta.shape[0] < period:
+        return 0.0
+    avg_gain = np.clip(delta, 0.0, None).mean()
+    avg_loss = np.clip(-delta, 0.0, None).mean()
+    if not avg_loss > 0 or np.isnan(avg_gain):
+        return 0.0
+    return float(100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+
+def volume_ma_last(series, period: int = 20) -> float:
+    """Last value of :func:`volume_ma`; NaN with fewer than ``period`` bars."""
+    values = np.asarray(series, dtype=np.float64)[-period:]
+    return float(values.mean()) if values.shape[0] == period else float("nan")
 
 
 def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """Average Directional Index (trend strength)."""
     high = df["high"]
     low = df["low"]
-    close = df["close"]
 
     up_move = high.diff()
     down_move = -low.diff()
@@ -61,21 +208,11 @@ def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     plus_dm = up_move.where((up_move > down_move) & (up_move > 0), 0.0)
     minus_dm = down_move.where((down_move > up_move) & (down_move > 0), 0.0)
 
-    prev_close = close.shift(1)
-    tr = pd.concat(
-        [
-            (high - low).abs(),
-            (high - prev_close).abs(),
-            (low - prev_close).abs(),
-        ],
-        axis=1,
-    ).max(axis=1)
-
-    atr_val = tr.rolling(window=period).mean()
-    plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr_val.replace(0, pd.NA))
-    minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr_val.replace(0, pd.NA))
-    dx = (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, pd.NA) * 100
-    return dx.rolling(window=period).mean()
+    atr_val = atr(df, period)
+    plus_di = 100 * _safe_divide(plus_dm.rolling(window=period).mean(), atr_val)
+    minus_di = 100 * _safe_divide(minus_dm.rolling(window=period).mean(), atr_val)
+    dx = _safe_divide(np.abs(plus_di - minus_di), plus_di + minus_di) * 100
+    return pd.Series(dx, index=df.index).rolling(window=period).mean()
 
 
 def bollinger_bands(
@@ -85,7 +222,7 @@ def bollinger_bands(
     std = series.rolling(window=period).std()
     upper = mid + std * std_dev
     lower = mid - std * std_dev
-    bandwidth = (upper - lower) / mid.replace(0, pd.NA)
+    bandwidth = _safe_divide(upper - lower, mid)
     return pd.DataFrame(
         {"upper": upper, "mid": mid, "lower": lower, "bandwidth": bandwidth},
         index=series.index,
@@ -96,36 +233,71 @@ def volume_ma(series: pd.Series, period: int = 20) -> pd.Series:
     return series.rolling(window=period).mean()
 
 
-def atr_percentile(df: pd.DataFrame, period: int = 14, lookback: int = 100) -> pd.Series:
-    atr_series = atr(df, period)
-
-    def _percentile(window: np.ndarray) -> float:
-        current = window[-1]
+@njit(cache=True)
+def _percentile_rank_loop(x: np.ndarray, lookback: int) -> np.ndarray:
+    """Share of the trailing ``lookback`` non-NaN values <= the current one, in %."""
+    n = x.shape[0]
+    out = np.zeros(n)
+    for i in range(n):
+        current = x[i]
         if np.isnan(current):
-            return 0.0
-        values = window[~np.isnan(window)]
-        if values.size == 0:
-            return 0.0
-        sorted_vals = np.sort(values)
-        rank = np.searchsorted(sorted_vals, current, side="right")
-        return (rank / sorted_vals.size) * 100.0
+            continue
+        count = 0
+        rank = 0
+        for j in range(max(0, i - lookback + 1), i + 1):
+            val = x[j]
+            if not np.isnan(val):
+                count += 1
+                if val <= current:
+                    rank += 1
+        # Matches rolling(min_periods=2): fewer than two observations -> 0.
+        if count >= 2:
+            out[i] = (rank / count) * 100.0
+    return out
 
-    return atr_series.rolling(window=lookback, min_periods=2).apply(
-        _percentile, raw=True
-    ).fillna(0.0)
+
+def atr_percentile(df: pd.DataFrame, period: int = 14, lookback: int = 100) -> pd.Series:
+    atr_values = atr(df, period).to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.Series(_percentile_rank_loop(atr_values, int(lookback)), index=df.index)
 
 
 def price_efficiency(df: pd.DataFrame, period: int = 20) -> pd.Series:
-    close = df["close"].astype(float)
-    net_change = close.diff(period).abs()
-    total_move = close.diff().abs().rolling(window=period).sum()
-    efficiency = net_change / total_move.replace(0, pd.NA)
-    return efficiency.fillna(0.0)
+    close = df["close"].to_numpy(dtype=np.float64, na_value=np.nan)
+    net_change = np.full_like(close, np.nan)
+    total_move = np.full_like(close, np.nan)
+    if 0 < period < len(close):
+        net_change[period:] = np.abs(close[period:] - close[:-period])
+        # Rolling sum of |diff| as a prefix-sum difference; a window with any
+        # missing move stays NaN, as with pandas rolling(period).sum().
+        move = np.abs(np.diff(close))
+        missing = np.isnan(move)
+        move_sum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, move))))
+        missing_sum = np.concatenate(([0], np.cumsum(missing)))
+        window_move = move_sum[period:] - move_sum[:-period]
+        window_move[(missing_sum[period:] - missing_sum[:-period]) > 0] = np.nan
+        total_move[period:] = window_move
+    efficiency = _safe_divide(net_change, total_move)
+    return pd.Series(efficiency, index=df.index).fillna(0.0)
 
 
 def volume_trend(df: pd.DataFrame, period: int = 20) -> pd.Series:
     volume = df["volume"].astype(float).fillna(0.0)
     vol_ma = volume.rolling(window=period).mean()
     prev_ma = vol_ma.shift(period)
-    trend = (vol_ma - prev_ma) / prev_ma.replace(0, pd.NA)
-    return trend.fillna(0.0)
+    trend = _safe_divide(vol_ma - prev_ma, prev_ma)
+    return pd.Series(trend, index=df.index).fillna(0.0)
+
+
+def warmup() -> None:
+    """Compile (or load from cache) the indicator kernels before the first signal."""
+    if not NUMBA_AVAILABLE:
+        return
+    bars = np.linspace(1.0, 2.0, 8)
+    _ema_loop(bars, 0.5)
+    _rolling_mean_loop(bars, 2)
+    _rsi_loop(bars, 2)
+    _percentile_rank_loop(bars, 2)
+
+
+if settings.jit_warmup:
+    warmup()
@@ -0,0 +1,121 @@
+"""Polars expression counterparts of :mod:`indicators` for batch/backtest runs.
+
+Each helper returns ``pl.Expr`` objects so a whole indicator set is evaluated
+in one parallel ``with_columns`` pass; :func:`add_indicators` can partition
+them per symbol with ``.over()``. The pandas helpers remain the live path.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, TypeVar
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None
+
+Frame = TypeVar("Frame")
+
+
+def _require_polars() -> None:
+    if pl is None:
+        raise ImportError("polars is required for indicators_pl. Install it before use.")
+
+
+def ema(column: str, span: int) -> "pl.Expr":
+    _require_polars()
+    return pl.col(column).ewm_mean(span=span, adjust=False)
+
+
+def macd(
+    column: str = "close", fast: int = 12, slow: int = 26, signal: int = 9
+) -> List["pl.Expr"]:
+    macd_line = ema(column, fast) - ema(column, slow)
+    signal_line = macd_line.ewm_mean(span=signal, adjust=False)
+    return [
+        macd_line.alias("macd"),
+        signal_line.alias("signal"),
+        (macd_line - signal_line).alias("hist"),
+    ]
+
+
+def rsi(column: str = "close", period: int = 14) -> "pl.Expr":
+    _require_polars()
+    delta = pl.col(column).diff()
+    avg_gain = delta.clip(lower_bound=0).rolling_mean(window_size=period)
+    avg_loss = (-delta).clip(lower_bound=0).rolling_mean(window_size=period)
+    # Zero or missing average loss maps to 0, as in indicators.rsi.
+    return (
+        pl.when(avg_loss != 0)
+        .then(100 - 100 / (1 + avg_gain / avg_loss))
+        .otherwise(0.0)
+        .alias("rsi")
+    )
+
+
+def true_range() -> "pl.Expr":
+    _require_polars()
+    high, low = pl.col("high"), pl.col("low")
+    prev_close = pl.col("close").shift(1)
+    # max_horizontal skips nulls, so the first bar keeps |high - low|.
+    return pl.max_horizontal(
+        (high - low).abs(), (high - prev_close).abs(), (low - prev_close).abs()
+    )
+
+
+def atr(period: int = 14) -> "pl.Expr":
+    return true_range().rolling_mean(window_size=period).alias("atr")
+
+
+def bollinger_bands(
+    column: str = "close", period: int = 20, std_dev: float = 2.0
+) -> List["pl.Expr"]:
+    _require_polars()
+    mid = pl.col(column).rolling_mean(window_size=period)
+    std = pl.col(column).rolling_std(window_size=period)
+    upper = mid + std * std_dev
+    lower = mid - std * std_dev
+    bandwidth = pl.when(mid != 0).then((upper - lower) / mid)
+    return [
+        upper.alias("upper"),
+        mid.alias("mid"),
+        lower.alias("lower"),
+        bandwidth.alias("bandwidth"),
+    ]
+
+
+def volume_ma(column: str = "volume", period: int = 20) -> "pl.Expr":
+    _require_polars()
+    return pl.col(column).rolling_mean(window_size=period).alias("volume_ma")
+
+
+def indicator_set(
+    ema_spans: Sequence[int] = (9, 21, 55),
+    rsi_period: int = 14,
+    atr_period: int = 14,
+    bb_period: int = 20,
+    bb_std: float = 2.0,
+    volume_period: int = 20,
+) -> List["pl.Expr"]:
+    """The strategy library's indicator columns as one expression list."""
+    exprs = [ema("close", span).alias(f"ema_{span}") for span in ema_spans]
+    exprs += macd("close")
+    exprs.append(rsi("close", rsi_period))
+    exprs.append(atr(atr_period))
+    exprs += bollinger_bands("close", bb_period, bb_std)
+    exprs.append(volume_ma("volume", volume_period))
+    return exprs
+
+
+def add_indicators(
+    frame: Frame, exprs: Optional[Sequence["pl.Expr"]] = None, by: Optional[str] = None
+) -> Frame:
+    """Append ``exprs`` (default :func:`indicator_set`) to a time-sorted (Lazy)Frame.
+
+    With ``by`` (e.g. ``"symbol"``) every expression runs per partition, so a
+    multi-symbol frame needs no Python-level loop.
+    """
+    exprs = list(exprs) if exprs is not None else indicator_set()
+    if by is not None:
+        exprs = [expr.over(by) for expr in exprs]
+    return frame.with_columns(exprs)
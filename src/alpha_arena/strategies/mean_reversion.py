@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
+from math import isfinite
 from typing import Dict, Optional
 
-import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from alpha_arena.strategies.base import BaseStrategy
-from alpha_arena.strategies.indicators import adx, rsi
+from alpha_arena.strategies.indicators import adx, rsi_last, tail
 from alpha_arena.strategies.signals import SignalType, StrategySignal
 
 logger = logging.getLogger(__name__)
@@ -47,55 +48,69 @@ class MeanReversionStrategy(BaseStrategy):
             params=default_params,
             data_limit=data_limit,
         )
+        self._ma_period = int(default_params["ma_period"])
+        self._std_period = int(default_params["std_period"])
+        self._entry_std = float(default_params["entry_std"])
+        self._exit_std = float(default_params["exit_std"])
+        self._rsi_period = int(default_params["rsi_period"])
+        self._rsi_oversold = float(default_params["rsi_oversold"])
+        self._rsi_overbought = float(default_params["rsi_overbought"])
+        self._stop_loss_pct = float(default_params["stop_loss_pct"])
+        self._max_position = default_params["max_position"]
+        self._max_leverage = default_params["max_leverage"]
 
     def generate_signal(self) -> StrategySignal:
         """Generate mean reversion entry/exit signals."""
         try:
-            df = self.get_candles()
+            bars = self.get_candles_np()
         except Exception as exc:
             logger.exception("MeanReversionStrategy failed to load candles: %s", exc)
             return self._hold("data_error")
+        df = bars.frame
 
         required_cols = {"timestamp", "high", "low", "close"}
         if df.empty or not required_cols.issubset(df.columns):
             return self._hold("not_enough_data")
 
-        ma_period = int(self.params["ma_period"])
-        std_period = int(self.params["std_period"])
-        rsi_period = int(self.params["rsi_period"])
+        ma_period = self._ma_period
+        std_period = self._std_period
+        rsi_period = self._rsi_period
         min_len = max(ma_period + 2, std_period + 2, rsi_period + 2)
         if len(df) < min_len:
             return self._hold("not_enough_data")
 
         try:
-            df = df.copy()
-            df["ma"] = df["close"].rolling(window=ma_period).mean()
-            df["std"] = df["close"].rolling(window=std_period).std()
-            df["rsi"] = rsi(df["close"], rsi_period)
-            df["adx"] = adx(df, rsi_period)
-
-            last = df.iloc[-1]
-            prev = df.iloc[-2]
-            price = float(last["close"])
-            ts = int(last["timestamp"])
+            # Only the last two bars are read: [-2] and [-1] of each stat.
+            close_arr = bars["close"]
+            ma_arr = sliding_window_view(close_arr[-(ma_period + 1) :], ma_period).mean(
+                axis=1
+            )
+            std_arr = sliding_window_view(
+                close_arr[-(std_period + 1) :], std_period
+            ).std(axis=1, ddof=1)
+            rsi_val = rsi_last(close_arr, rsi_period)
+            # ADX smooths an already smoothed DX, so it needs two periods of rows.
+            adx_last = adx(tail(df, 2 * rsi_period - 1), rsi_period).iat[-1]
+            price = float(close_arr[-1])
+            ts = int(bars["timestamp"][-1])
             if price <= 0:
                 return self._hold("invalid_price")
 
-            mean = float(last["ma"]) if pd.notna(last["ma"]) else 0.0
-            std = float(last["std"]) if pd.notna(last["std"]) else 0.0
-            if mean <= 0 or std <= 0:
+            mean, prev_mean = float(ma_arr[-1]), float(ma_arr[-2])
+            std, prev_std = float(std_arr[-1]), float(std_arr[-2])
+            if not (isfinite(mean) and isfinite(std)) or mean <= 0 or std <= 0:
                 return self._hold("invalid_stats")
 
             z_score = (price - mean) / std
-            prev_mean = float(prev["ma"]) if pd.notna(prev["ma"]) else mean
-            prev_std = float(prev["std"]) if pd.notna(prev["std"]) else std
-            prev_z = (float(prev["close"]) - prev_mean) / prev_std if prev_std else 0.0
+            prev_mean = prev_mean if isfinite(prev_mean) else mean
+            prev_std = prev_std if isfinite(prev_std) else std
+            prev_z = (float(close_arr[-2]) - prev_mean) / prev_std if prev_std else 0.0
 
-            rsi_val = float(last["rsi"]) if pd.notna(last["rsi"]) else 0.0
-            adx_val = float(last["adx"]) if pd.notna(last["adx"]) else 0.0
+            adx_val = float(adx_last)
+            adx_val = adx_val if isfinite(adx_val) else 0.0
 
-            entry_std = float(self.params["entry_std"])
-            exit_std = float(self.params["exit_std"])
+            entry_std = self._entry_std
+            exit_std = self._exit_std
 
             # Trend filter: skip mean reversion when trend strength is high.
             if adx_val > 25:
@@ -105,8 +120,8 @@ class MeanReversionStrategy(BaseStrategy):
                     return self._close_long(price, ts, "mean_reversion_exit_long")
                 return self._hold("trend_filter")
 
-            if rsi_val < float(self.params["rsi_oversold"]) and z_score <= -entry_std:
-                stop_loss = price * (1 - float(self.params["stop_loss_pct"]))
+            if rsi_val < self._rsi_oversold and z_score <= -entry_std:
+                stop_loss = price * (1 - self._stop_loss_pct)
                 return StrategySignal(
                     strategy=self.name,
                     symbol=self.symbol,
@@ -117,13 +132,13 @@ class MeanReversionStrategy(BaseStrategy):
                     price=price,
                     stop_loss=stop_loss,
                     take_profit=mean,
-                    position_size=self.params["max_position"],
-                    leverage=self.params["max_leverage"],
+                    position_size=self._max_position,
+                    leverage=self._max_leverage,
                     reasoning=f"Z-score {z_score:.2f} and RSI {rsi_val:.1f} oversold.",
                 )
 
-            if rsi_val > float(self.params["rsi_overbought"]) and z_score >= entry_std:
-                stop_loss = price * (1 + float(self.params["stop_loss_pct"]))
+            if rsi_val > self._rsi_overbought and z_score >= entry_std:
+                stop_loss = price * (1 + self._stop_loss_pct)
                 return StrategySignal(
                     strategy=self.name,
                     symbol=self.symbol,
@@ -134,8 +149,8 @@ class MeanReversionStrategy(BaseStrategy):
                     price=price,
                     stop_loss=stop_loss,
                     take_profit=mean,
-                    position_size=self.params["max_position"],
-                    leverage=self.params["max_leverage"],
+                    position_size=self._max_position,
+                    leverage=self._max_leverage,
                     reasoning=f"Z-score {z_score:.2f} and RSI {rsi_val:.1f} overbought.",
                 )
 
@@ -183,15 +198,8 @@ class MeanReversionStrategy(BaseStrategy):
         )
 
     def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        try:
-            df = self.get_candles()
-        except Exception:
-            df = pd.DataFrame()
-        if not df.empty:
-            ts = int(df.iloc[-1]["timestamp"])
-            price = float(df.iloc[-1]["close"])
+        # Reuse the bar from this cycle's fetch instead of reloading candles.
+        ts, price = self._last_bar or (0, 0.0)
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
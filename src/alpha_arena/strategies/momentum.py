@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
-import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
+from alpha_arena.strategies._momentum_kernels import momentum_stats
 from alpha_arena.strategies.base import BaseStrategy
-from alpha_arena.strategies.indicators import atr, rsi, volume_ma
 from alpha_arena.strategies.signals import SignalType, StrategySignal
 
 logger = logging.getLogger(__name__)
@@ -47,62 +48,65 @@ class MomentumStrategy(BaseStrategy):
             params=default_params,
             data_limit=data_limit,
         )
+        self._momentum_period = int(default_params["momentum_period"])
+        self._price_threshold = float(default_params["price_momentum_threshold"])
+        self._volume_threshold = float(default_params["volume_momentum_threshold"])
+        self._rsi_period = int(default_params["rsi_period"])
+        self._rsi_threshold = float(default_params["rsi_momentum_threshold"])
+        self._atr_period = int(default_params["atr_period"])
+        self._stop_loss_atr = float(default_params["stop_loss_atr"])
+        self._take_profit_atr = float(default_params["take_profit_atr"])
+        self._max_position = default_params["max_position"]
+        self._max_leverage = default_params["max_leverage"]
 
     def generate_signal(self) -> StrategySignal:
         """Generate momentum signals with multi-factor confirmation."""
         try:
-            df = self.get_candles()
+            bars = self.get_candles_np()
         except Exception as exc:
             logger.exception("MomentumStrategy failed to load candles: %s", exc)
             return self._hold("data_error")
+        df = bars.frame
 
         required_cols = {"timestamp", "high", "low", "close", "volume"}
         if df.empty or not required_cols.issubset(df.columns):
             return self._hold("not_enough_data")
 
-        momentum_period = int(self.params["momentum_period"])
-        rsi_period = int(self.params["rsi_period"])
-        atr_period = int(self.params["atr_period"])
+        momentum_period = self._momentum_period
+        rsi_period = self._rsi_period
+        atr_period = self._atr_period
         min_len = max(momentum_period + 2, rsi_period + 2, atr_period + 2)
         if len(df) < min_len:
             return self._hold("not_enough_data")
 
         try:
-            df = df.copy()
-            df["atr"] = atr(df, atr_period)
-            df["rsi"] = rsi(df["close"], rsi_period)
-            df["volume_ma"] = volume_ma(df["volume"], momentum_period)
-
-            # Momentum uses percentage change across the lookback window.
-            df["price_momentum"] = df["close"].pct_change(periods=momentum_period).fillna(0.0)
-            rsi_base = df["rsi"].shift(momentum_period)
-            rsi_base = rsi_base.where(rsi_base != 0)
-            df["rsi_momentum"] = ((df["rsi"] - rsi_base) / rsi_base * 100).fillna(0.0)
-
-            last = df.iloc[-1]
-            prev = df.iloc[-2]
-            price = float(last["close"])
-            ts = int(last["timestamp"])
+            close_arr = bars["close"]
+            price = float(close_arr[-1])
+            ts = int(bars["timestamp"][-1])
             if price <= 0:
                 return self._hold("invalid_price")
 
-            price_mom = float(last["price_momentum"]) if pd.notna(last["price_momentum"]) else 0.0
-            price_mom_prev = (
-                float(prev["price_momentum"]) if pd.notna(prev["price_momentum"]) else 0.0
-            )
-            rsi_mom = float(last["rsi_momentum"]) if pd.notna(last["rsi_momentum"]) else 0.0
-            rsi_mom_prev = (
-                float(prev["rsi_momentum"]) if pd.notna(prev["rsi_momentum"]) else 0.0
-            )
-
-            volume_ma_val = float(last["volume_ma"]) if pd.notna(last["volume_ma"]) else 0.0
-            volume_ratio = (
-                float(last["volume"] / volume_ma_val) if volume_ma_val > 0 else 0.0
+            # Price/RSI momentum, volume ratio and ATR of the last bars in one pass.
+            (
+                price_mom_prev,
+                price_mom,
+                rsi_mom_prev,
+                rsi_mom,
+                volume_ratio,
+                atr_val,
+            ) = momentum_stats(
+                close_arr,
+                bars["high"],
+                bars["low"],
+                bars["volume"],
+                momentum_period,
+                rsi_period,
+                atr_period,
             )
 
-            price_threshold = float(self.params["price_momentum_threshold"])
-            volume_threshold = float(self.params["volume_momentum_threshold"])
-            rsi_threshold = float(self.params["rsi_momentum_threshold"])
+            price_threshold = self._price_threshold
+            volume_threshold = self._volume_threshold
+            rsi_threshold = self._rsi_threshold
 
             # Require alignment plus persistence to avoid choppy market signals.
             long_confirmed = (
@@ -120,50 +124,14 @@ class MomentumStrategy(BaseStrategy):
                 and rsi_mom_prev < 0
             )
 
-            atr_val = float(last["atr"]) if pd.notna(last["atr"]) else 0.0
-
             if long_confirmed:
-                stop_loss = price - atr_val * self.params["stop_loss_atr"] if atr_val else None
-                take_profit = price + atr_val * self.params["take_profit_atr"] if atr_val else None
-                return StrategySignal(
-                    strategy=self.name,
-                    symbol=self.symbol,
-                    timeframe=self.timeframe,
-                    signal_type=SignalType.BUY,
-                    confidence=0.8,
-                    timestamp=ts,
-                    price=price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    position_size=self.params["max_position"],
-                    leverage=self.params["max_leverage"],
-                    reasoning=(
-                        "Momentum aligned up: "
-                        f"price {price_mom:.2%}, volume {volume_ratio:.2f}x, "
-                        f"rsi {rsi_mom:.2f}%."
-                    ),
+                return self._momentum_signal(
+                    SignalType.BUY, ts, price, atr_val, price_mom, volume_ratio, rsi_mom
                 )
 
             if short_confirmed:
-                stop_loss = price + atr_val * self.params["stop_loss_atr"] if atr_val else None
-                take_profit = price - atr_val * self.params["take_profit_atr"] if atr_val else None
-                return StrategySignal(
-                    strategy=self.name,
-                    symbol=self.symbol,
-                    timeframe=self.timeframe,
-                    signal_type=SignalType.SELL,
-                    confidence=0.8,
-                    timestamp=ts,
-                    price=price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    position_size=self.params["max_position"],
-                    leverage=self.params["max_leverage"],
-                    reasoning=(
-                        "Momentum aligned down: "
-                        f"price {price_mom:.2%}, volume {volume_ratio:.2f}x, "
-                        f"rsi {rsi_mom:.2f}%."
-                    ),
+                return self._momentum_signal(
+                    SignalType.SELL, ts, price, atr_val, price_mom, volume_ratio, rsi_mom
                 )
 
             if (
@@ -178,16 +146,149 @@ class MomentumStrategy(BaseStrategy):
             logger.exception("MomentumStrategy failed during signal generation: %s", exc)
             return self._hold("error")
 
+    @classmethod
+    def generate_signals_batch(
+        cls, strategies: Sequence[BaseStrategy]
+    ) -> List[StrategySignal]:
+        """Evaluate same-params instances across symbols with one 2-D NumPy pass."""
+        strategies = list(strategies)
+        params = strategies[0].params if strategies else {}
+        if len(strategies) < 2 or any(s.params != params for s in strategies):
+            return super().generate_signals_batch(strategies)
+
+        head = strategies[0]
+        mp, rp, ap = head._momentum_period, head._rsi_period, head._atr_period
+        window = max(mp + rp + 2, ap + 1)
+        required_cols = {"timestamp", "high", "low", "close", "volume"}
+        bars = []
+        for strategy in strategies:
+            try:
+                bars.append(strategy.get_candles_np())
+            except Exception:
+                bars.append(None)
+        ready = [
+            i
+            for i, b in enumerate(bars)
+            if b is not None
+            and len(b.frame) >= window
+            and required_cols.issubset(b.frame.columns)
+        ]
+        # Short, malformed or failed loads take the per-instance path and its HOLDs.
+        signals: List[Optional[StrategySignal]] = [None] * len(strategies)
+        for i in set(range(len(strategies))) - set(ready):
+            signals[i] = strategies[i].generate_signal()
+        if not ready:
+            return signals
+
+        def stack(column: str, count: int) -> np.ndarray:
+            return np.stack([bars[i][column][-count:] for i in ready])
+
+        close = stack("close", window)
+        high = stack("high", ap)
+        low = stack("low", ap)
+        volume = stack("volume", mp)
+        price = close[:, -1]
+
+        # Same definitions as generate_signal, last two bars only.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_mom = close[:, -2:] / close[:, [window - 2 - mp, window - 1 - mp]] - 1.0
+            price_mom = np.where(np.isnan(price_mom), 0.0, price_mom)
+
+            delta = np.diff(close, axis=1)
+            avg_gain = sliding_window_view(np.clip(delta, 0.0, None), rp, axis=1).mean(axis=2)
+            avg_loss = sliding_window_view(np.clip(-delta, 0.0, None), rp, axis=1).mean(axis=2)
+            rsi_val = 100 - 100 / (1 + avg_gain / avg_loss)
+            # rsi_val[:, t] belongs to close column t + rp.
+            rsi_val = np.where((avg_loss != 0) & np.isfinite(rsi_val), rsi_val, 0.0)
+            cols = np.array([window - 2, window - 1]) - rp
+            rsi_now, rsi_base = rsi_val[:, cols], rsi_val[:, cols - mp]
+            rsi_mom = np.where(rsi_base != 0, (rsi_now - rsi_base) / rsi_base * 100, 0.0)
+
+            volume_ma_val = volume.mean(axis=1)
+            volume_ma_val = np.where(np.isfinite(volume_ma_val), volume_ma_val, 0.0)
+            volume_ratio = np.where(volume_ma_val > 0, volume[:, -1] / volume_ma_val, 0.0)
+
+            prev_close = close[:, -ap - 1 : -1]
+            true_range = np.fmax(
+                np.fmax(np.abs(high - low), np.abs(high - prev_close)),
+                np.abs(low - prev_close),
+            )
+            atr_val = true_range.mean(axis=1)
+            atr_val = np.where(np.isfinite(atr_val), atr_val, 0.0)
+
+        pth, vth, rth = head._price_threshold, head._volume_threshold, head._rsi_threshold
+        volume_ok = volume_ratio >= vth
+        buy = (
+            (price_mom[:, 1] >= pth)
+            & volume_ok
+            & (rsi_mom[:, 1] >= rth)
+            & (price_mom[:, 0] > 0)
+            & (rsi_mom[:, 0] > 0)
+        )
+        sell = (
+            ~buy
+            & (price_mom[:, 1] <= -pth)
+            & volume_ok
+            & (rsi_mom[:, 1] <= -rth)
+            & (price_mom[:, 0] < 0)
+            & (rsi_mom[:, 0] < 0)
+        )
+        weak = ~volume_ok | (np.abs(price_mom[:, 1]) < pth) | (np.abs(rsi_mom[:, 1]) < rth)
+
+        for row, i in enumerate(ready):
+            strategy = strategies[i]
+            row_price = float(price[row])
+            if row_price <= 0:
+                signals[i] = strategy._hold("invalid_price")
+            elif buy[row] or sell[row]:
+                signals[i] = strategy._momentum_signal(
+                    SignalType.BUY if buy[row] else SignalType.SELL,
+                    int(bars[i]["timestamp"][-1]),
+                    row_price,
+                    float(atr_val[row]),
+                    float(price_mom[row, 1]),
+                    float(volume_ratio[row]),
+                    float(rsi_mom[row, 1]),
+                )
+            else:
+                signals[i] = strategy._hold("weak_momentum" if weak[row] else "no_signal")
+        return signals
+
+    def _momentum_signal(
+        self,
+        side: SignalType,
+        ts: int,
+        price: float,
+        atr_val: float,
+        price_mom: float,
+        volume_ratio: float,
+        rsi_mom: float,
+    ) -> StrategySignal:
+        direction = 1.0 if side == SignalType.BUY else -1.0
+        return StrategySignal(
+            strategy=self.name,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            signal_type=side,
+            confidence=0.8,
+            timestamp=ts,
+            price=price,
+            stop_loss=price - direction * atr_val * self._stop_loss_atr if atr_val else None,
+            take_profit=(
+                price + direction * atr_val * self._take_profit_atr if atr_val else None
+            ),
+            position_size=self._max_position,
+            leverage=self._max_leverage,
+            reasoning=(
+                f"Momentum aligned {'up' if direction > 0 else 'down'}: "
+                f"price {price_mom:.2%}, volume {volume_ratio:.2f}x, "
+                f"rsi {rsi_mom:.2f}%."
+            ),
+        )
+
     def _hold(self, reason: str) -> StrategySignal:
-        ts = 0
-        price = 0.0
-        try:
-            df = self.get_candles()
-        except Exception:
-            df = pd.DataFrame()
-        if not df.empty:
-            ts = int(df.iloc[-1]["timestamp"])
-            price = float(df.iloc[-1]["close"])
+        # Reuse the bar from this cycle's fetch instead of reloading candles.
+        ts, price = self._last_bar or (0, 0.0)
         return StrategySignal(
             strategy=self.name,
             symbol=self.symbol,
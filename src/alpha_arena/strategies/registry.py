@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from alpha_arena.data import DataService
 from alpha_arena.strategies.base import BaseStrategy
@@ -16,6 +16,9 @@ from alpha_arena.strategies.momentum import MomentumStrategy
 from alpha_arena.strategies.mean_reversion import MeanReversionStrategy
 
 
+__all__ = ["STRATEGY_SPECS", "StrategyFactory", "StrategyLibrary", "StrategySpec"]
+
+# Strategy classes are their own factories: (symbol, timeframe, data_service, params).
 StrategyFactory = Callable[[str, str, DataService, Optional[Dict]], BaseStrategy]
 
 
@@ -30,54 +33,14 @@ class StrategySpec:
     regimes: tuple[str, ...] = ()
 
 
-def _ema_factory(symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]) -> BaseStrategy:
-    return EMATrendStrategy(symbol, timeframe, ds, params=params)
-
-
-def _bollinger_factory(
-    symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]
-) -> BaseStrategy:
-    return BollingerRangeStrategy(symbol, timeframe, ds, params=params)
-
-
-def _funding_factory(
-    symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]
-) -> BaseStrategy:
-    return FundingRateArbitrageStrategy(symbol, timeframe, ds, params=params)
-
-
-def _grid_trading_factory(
-    symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]
-) -> BaseStrategy:
-    return GridTradingStrategy(symbol, timeframe, ds, params=params)
-
-
-def _breakout_factory(
-    symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]
-) -> BaseStrategy:
-    return BreakoutStrategy(symbol, timeframe, ds, params=params)
-
-
-def _momentum_factory(
-    symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]
-) -> BaseStrategy:
-    return MomentumStrategy(symbol, timeframe, ds, params=params)
-
-
-def _mean_reversion_factory(
-    symbol: str, timeframe: str, ds: DataService, params: Optional[Dict]
-) -> BaseStrategy:
-    return MeanReversionStrategy(symbol, timeframe, ds, params=params)
-
-
-STRATEGY_SPECS: List[StrategySpec] = [
+STRATEGY_SPECS: Tuple[StrategySpec, ...] = (
     StrategySpec(
         key="ema_trend",
         name="EMA Trend",
         enabled=True,
         implemented=True,
         description="EMA trend-following strategy",
-        factory=_ema_factory,
+        factory=EMATrendStrategy,
         regimes=("TREND",),
     ),
     StrategySpec(
@@ -86,7 +49,7 @@ STRATEGY_SPECS: List[StrategySpec] = [
         enabled=True,
         implemented=True,
         description="Bollinger band range strategy",
-        factory=_bollinger_factory,
+        factory=BollingerRangeStrategy,
         regimes=("RANGE",),
     ),
     StrategySpec(
@@ -95,7 +58,7 @@ STRATEGY_SPECS: List[StrategySpec] = [
         enabled=True,
         implemented=True,
         description="Funding rate arbitrage strategy",
-        factory=_funding_factory,
+        factory=FundingRateArbitrageStrategy,
         regimes=(),
     ),
     StrategySpec(
@@ -104,7 +67,7 @@ STRATEGY_SPECS: List[StrategySpec] = [
         enabled=False,
         implemented=True,
         description="Key level / channel breakout strategy",
-        factory=_breakout_factory,
+        factory=BreakoutStrategy,
         regimes=("BREAKOUT", "TREND"),
     ),
     StrategySpec(
@@ -113,7 +76,7 @@ STRATEGY_SPECS: List[StrategySpec] = [
         enabled=False,
         implemented=True,
         description="Equal-spaced grid strategy centered on Bollinger mid-band",
-        factory=_grid_trading_factory,
+        factory=GridTradingStrategy,
         regimes=("RANGE",),
     ),
     StrategySpec(
@@ -122,7 +85,7 @@ STRATEGY_SPECS: List[StrategySpec] = [
         enabled=False,
         implemented=True,
         description="Multi-factor momentum strategy with confirmation",
-        factory=_momentum_factory,
+        factory=MomentumStrategy,
         regimes=("TREND", "BREAKOUT"),
     ),
     StrategySpec(
@@ -131,7 +94,7 @@ STRATEGY_SPECS: List[StrategySpec] = [
         enabled=False,
         implemented=True,
         description="Mean reversion strategy with Z-score and RSI",
-        factory=_mean_reversion_factory,
+        factory=MeanReversionStrategy,
         regimes=("RANGE",),
     ),
     StrategySpec(
@@ -161,7 +124,12 @@ STRATEGY_SPECS: List[StrategySpec] = [
         factory=None,
         regimes=("BREAKOUT",),
     ),
-]
+)
+
+_SPEC_INDEX: Dict[str, StrategySpec] = {spec.key: spec for spec in STRATEGY_SPECS}
+if len(_SPEC_INDEX) != len(STRATEGY_SPECS):
+    raise ValueError("STRATEGY_SPECS contains duplicate strategy keys")
+_ENABLED_SPECS: Tuple[StrategySpec, ...] = tuple(spec for spec in STRATEGY_SPECS if spec.enabled)
 
 
 class StrategyLibrary:
@@ -170,17 +138,14 @@ class StrategyLibrary:
     def __init__(self, data_service: DataService) -> None:
         self.data_service = data_service
 
-    def list_all(self) -> List[StrategySpec]:
-        return list(STRATEGY_SPECS)
+    def list_all(self) -> Tuple[StrategySpec, ...]:
+        return STRATEGY_SPECS
 
-    def list_enabled(self) -> List[StrategySpec]:
-        return [spec for spec in STRATEGY_SPECS if spec.enabled]
+    def list_enabled(self) -> Tuple[StrategySpec, ...]:
+        return _ENABLED_SPECS
 
     def get(self, key: str) -> Optional[StrategySpec]:
-        for spec in STRATEGY_SPECS:
-            if spec.key == key:
-                return spec
-        return None
+        return _SPEC_INDEX.get(key)
 
     def build(
         self, key: str, symbol: str, timeframe: str, params: Optional[Dict] = None
@@ -191,3 +156,13 @@ class StrategyLibrary:
         if not spec.implemented or not spec.factory:
             raise ValueError(f"Strategy not implemented: {key}")
         return spec.factory(symbol, timeframe, self.data_service, params)
+
+    def build_batch(
+        self,
+        key: str,
+        symbols: Sequence[str],
+        timeframe: str,
+        params: Optional[Dict] = None,
+    ) -> List[BaseStrategy]:
+        """Same-params instances, one per symbol, for ``generate_signals_batch``."""
+        return [self.build(key, symbol, timeframe, params) for symbol in symbols]
@@ -4,8 +4,18 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+try:
+    from enum import StrEnum
+except ImportError:  # pragma: no cover - Python < 3.11
 
-class SignalType(str, Enum):
+    class StrEnum(str, Enum):
+        """Members are plain strings: ``str(SignalType.BUY) == "BUY"``."""
+
+        __str__ = str.__str__
+        __format__ = str.__format__
+
+
+class SignalType(StrEnum):
     BUY = "BUY"
     SELL = "SELL"
     HOLD = "HOLD"
@@ -13,7 +23,7 @@ class SignalType(str, Enum):
     CLOSE_SHORT = "CLOSE_SHORT"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategySignal:
     strategy: str
     symbol: str
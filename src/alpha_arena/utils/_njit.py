@@ -0,0 +1,23 @@
+"""Optional numba ``njit`` with a pure-Python fallback."""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels still run (slowly) without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+else:
+    NUMBA_AVAILABLE = True
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]